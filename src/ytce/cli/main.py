@@ -2,23 +2,49 @@ from __future__ import annotations
 
 import argparse
 import os
-import platform
-import subprocess
 import sys
-from typing import Optional
+from functools import lru_cache
+from typing import Any, Optional
 
 from ytce.__version__ import __version__
-from ytce.config import init_project, load_config
-from ytce.errors import EXIT_SUCCESS, handle_error
-from ytce.pipelines.batch import run_batch
-from ytce.pipelines.channel_videos import run as run_channel_videos
-from ytce.pipelines.scraper import ScrapeConfig, scrape_channel
-from ytce.pipelines.video_comments import run as run_video_comments
-from ytce.storage.paths import channel_output_dir, channel_videos_path, channel_videos_path_with_format, video_comments_path
+from ytce.errors import EXIT_SUCCESS, EXIT_USER_ERROR, handle_error
+from ytce.storage.paths import (
+    channel_output_dir,
+    channel_videos_path_with_format,
+    comments_format,
+    video_comments_path,
+    videos_format,
+)
 from ytce.utils.progress import print_error, print_success
 
+# Pipelines (and their requests/pyarrow imports) and ytce.config (PyYAML)
+# are imported only once a subcommand has been parsed, so `ytce --help`
+# and `ytce --version` start fast.
 
-def build_parser() -> argparse.ArgumentParser:
+
+# One-line help per subcommand, in the order shown in `ytce --help`
+_COMMAND_HELP = {
+    "init": "Initialize a new ytce project",
+    "channel": "Download channel videos and comments",
+    "video": "Download single video metadata",
+    "comments": "Download comments for a video",
+    "open": "Open output directory in file manager",
+    "batch": "Scrape multiple channels from a file",
+}
+
+
+@lru_cache(maxsize=8)
+def build_parser(only: Optional[str] = None, stubs: bool = False) -> argparse.ArgumentParser:
+    """
+    Build the ytce argument parser. Each tree is built once and reused;
+    parse_args() does not mutate it.
+    
+    Args:
+        only: Register just this subcommand (used when argv already names it);
+              None builds the full tree.
+        stubs: With only=None, register each subcommand with just its help
+               line. Enough for `ytce --help` and invalid-command errors.
+    """
     parser = argparse.ArgumentParser(
         prog="ytce",
         description="YouTube Comment Explorer - Download videos and comments without API",
@@ -42,10 +68,22 @@ For more info: https://github.com/makararena/youtube-data-scraper
     )
     sub = parser.add_subparsers(dest="cmd", required=True, metavar="COMMAND")
 
-    # ytce init
+    if stubs and only is None:
+        for name, help_text in _COMMAND_HELP.items():
+            sub.add_parser(name, help=help_text)
+        return parser
+
+    for name, add_parser in _SUBCOMMANDS.items():
+        if only is None or name == only:
+            add_parser(sub)
+
+    return parser
+
+
+def _add_init_parser(sub: "argparse._SubParsersAction") -> None:
     p_init = sub.add_parser(
         "init",
-        help="Initialize a new ytce project",
+        help=_COMMAND_HELP["init"],
         description="Initialize a new ytce project with config file and output directory.",
         epilog="""
 Examples:
@@ -55,11 +93,13 @@ Examples:
         formatter_class=argparse.RawDescriptionHelpFormatter,
     )
     p_init.add_argument("--output-dir", default=None, help="Custom output directory (default: data)")
+    p_init.set_defaults(func=_run_init)
+
 
-    # ytce channel
+def _add_channel_parser(sub: "argparse._SubParsersAction") -> None:
     p_channel = sub.add_parser(
         "channel",
-        help="Download channel videos and comments",
+        help=_COMMAND_HELP["channel"],
         usage="ytce channel @channelname [options]",
         description="Downloads all videos from a YouTube channel and all comments for each video.",
         epilog="""
@@ -82,11 +122,13 @@ Examples:
     p_channel.add_argument("--dry-run", action="store_true", help="Preview what will be downloaded without actually downloading")
     p_channel.add_argument("--debug", action="store_true", help="Enable debug output")
     p_channel.add_argument("--format", choices=["json", "csv", "parquet"], default="json", help="Output format for videos (default: json). Comments always use same format.")
+    p_channel.set_defaults(func=_run_channel)
 
-    # ytce video
+
+def _add_video_parser(sub: "argparse._SubParsersAction") -> None:
     p_video = sub.add_parser(
         "video",
-        help="Download single video metadata",
+        help=_COMMAND_HELP["video"],
         usage="ytce video VIDEO_ID [options]",
         description="Downloads metadata for a single video (without comments).",
         epilog="""
@@ -100,11 +142,13 @@ Examples:
     p_video.add_argument("-o", "--output", default=None, help="Custom output path")
     p_video.add_argument("--debug", action="store_true", help="Enable debug output")
     p_video.add_argument("--format", choices=["json", "csv", "parquet"], default="json", help="Output format (default: json)")
+    p_video.set_defaults(func=_run_video)
+
 
-    # ytce comments
+def _add_comments_parser(sub: "argparse._SubParsersAction") -> None:
     p_comments = sub.add_parser(
         "comments",
-        help="Download comments for a video",
+        help=_COMMAND_HELP["comments"],
         usage="ytce comments VIDEO_ID [options]",
         description="Downloads all comments from a single YouTube video.",
         epilog="""
@@ -121,11 +165,13 @@ Examples:
     p_comments.add_argument("--limit", type=int, default=None, help="Limit number of comments")
     p_comments.add_argument("--language", default=None, help="Language code (default: from config or 'en')")
     p_comments.add_argument("--format", choices=["jsonl", "csv", "parquet"], default="jsonl", help="Output format (default: jsonl)")
+    p_comments.set_defaults(func=_run_comments)
 
-    # ytce open
+
+def _add_open_parser(sub: "argparse._SubParsersAction") -> None:
     p_open = sub.add_parser(
         "open",
-        help="Open output directory in file manager",
+        help=_COMMAND_HELP["open"],
         usage="ytce open @channel|VIDEO_ID",
         description="Opens the output directory for a channel or video in your system file manager.",
         epilog="""
@@ -136,11 +182,13 @@ Examples:
         formatter_class=argparse.RawDescriptionHelpFormatter,
     )
     p_open.add_argument("identifier", metavar="@channel|VIDEO_ID", help="Channel handle or video ID")
+    p_open.set_defaults(func=_run_open)
+
 
-    # ytce batch
+def _add_batch_parser(sub: "argparse._SubParsersAction") -> None:
     p_batch = sub.add_parser(
         "batch",
-        help="Scrape multiple channels from a file",
+        help=_COMMAND_HELP["batch"],
         usage="ytce batch <channels_file> [options]",
         description="Scrape multiple channels listed in a file. Uses same options as 'ytce channel'.",
         epilog="""
@@ -164,16 +212,47 @@ Examples:
     p_batch.add_argument("--dry-run", action="store_true", help="Preview what will be downloaded without actually downloading")
     p_batch.add_argument("--sleep-between", type=int, default=2, help="Seconds to sleep between channels (default: 2)")
     p_batch.add_argument("--debug", action="store_true", help="Enable debug output")
+    p_batch.set_defaults(func=_run_batch)
 
-    return parser
 
+# Same order as _COMMAND_HELP
+_SUBCOMMANDS = {
+    "init": _add_init_parser,
+    "channel": _add_channel_parser,
+    "video": _add_video_parser,
+    "comments": _add_comments_parser,
+    "open": _add_open_parser,
+    "batch": _add_batch_parser,
+}
 
-def open_directory(path: str) -> None:
-    """Open a directory in the system file manager."""
-    if not os.path.exists(path):
-        print_error(f"Directory not found: {path}")
-        return
+
+def _is_help_flag(arg: str) -> bool:
+    # argparse accepts unambiguous prefixes, so "--he" means --help too
+    return arg == "-h" or (len(arg) > 2 and "--help".startswith(arg))
+
+
+def _sniff_subcommand(argv: Optional[list[str]]) -> Optional[str]:
+    """
+    Return the subcommand argv selects, so only its parser is built.
     
+    Global options before the command (e.g. -v) are skipped. Returns None
+    for root help, a missing command or an unknown command.
+    """
+    args = sys.argv[1:] if argv is None else argv
+    for arg in args:
+        if _is_help_flag(arg):
+            return None
+        if not arg.startswith("-"):
+            return arg if arg in _SUBCOMMANDS else None
+    return None
+
+
+def open_directory(path: str) -> None:
+    """Open an existing directory in the system file manager."""
+    # Only `ytce open` needs these, so keep them off the startup path
+    import platform
+    import subprocess
+
     system = platform.system()
     try:
         if system == "Darwin":  # macOS
@@ -190,6 +269,142 @@ def open_directory(path: str) -> None:
         print_error(f"Failed to open directory: {e}")
 
 
+def _run_init(args: argparse.Namespace, config: dict[str, Any]) -> int:
+    from ytce.config import init_project
+    init_project(args.output_dir)
+    return EXIT_SUCCESS
+
+
+def _run_open(args: argparse.Namespace, config: dict[str, Any]) -> int:
+    base_dir = config.get("output_dir", "data")
+    # Try to determine if it's a channel or video (channel first); each
+    # candidate is stat'ed once and opened without re-checking
+    identifier = args.identifier
+    channel_dir = channel_output_dir(identifier, base_dir=base_dir)
+    video_dir = os.path.join(base_dir, identifier)
+    for candidate in (channel_dir, video_dir):
+        if os.path.exists(candidate):
+            open_directory(candidate)
+            return EXIT_SUCCESS
+    # Not found
+    print_error(f"No data found for: {identifier}")
+    print_error(f"Searched in: {base_dir}")
+    return EXIT_USER_ERROR
+
+
+def _run_channel(args: argparse.Namespace, config: dict[str, Any]) -> int:
+    base_dir = config.get("output_dir", "data")
+    debug = getattr(args, "debug", False)
+    # Merge config with args
+    sort = args.sort or config.get("comment_sort", "recent")
+    language = args.language or config.get("language", "en")
+    dry_run = getattr(args, "dry_run", False)
+    format_arg = getattr(args, "format", "json")
+    
+    # For channel command, format applies to both videos and comments
+    comment_format = comments_format(format_arg)
+    
+    if args.videos_only:
+        # Only download videos metadata (use legacy pipeline)
+        from ytce.pipelines.channel_videos import run as run_channel_videos
+        out_dir = args.out_dir or channel_output_dir(args.channel_id, base_dir=base_dir)
+        output = os.path.join(out_dir, f"videos.{videos_format(format_arg)}")
+        run_channel_videos(
+            channel_id=args.channel_id,
+            output=output,
+            max_videos=args.limit,
+            debug=debug,
+            format=format_arg,
+        )
+    else:
+        # Download videos + comments (use new refactored scraper)
+        from ytce.pipelines.scraper import ScrapeConfig, scrape_channel
+        scrape_config = ScrapeConfig(
+            channel_id=args.channel_id,
+            out_dir=args.out_dir,
+            base_dir=base_dir,
+            max_videos=args.limit,
+            per_video_limit=args.per_video_limit,
+            sort=sort,
+            language=language,
+            format=comment_format,
+            debug=debug,
+            videos_only=False,
+            dry_run=dry_run,
+            quiet=False,
+        )
+        scrape_channel(scrape_config)
+    return EXIT_SUCCESS
+
+
+def _run_video(args: argparse.Namespace, config: dict[str, Any]) -> int:
+    base_dir = config.get("output_dir", "data")
+    format_arg = getattr(args, "format", "json")
+    if args.output:
+        output = args.output
+    else:
+        output = channel_videos_path_with_format(args.video_id, base_dir=base_dir, format=format_arg)
+    # For single video, we'll just create a minimal videos.json/csv
+    from ytce.pipelines.channel_videos import run as run_channel_videos
+    run_channel_videos(
+        channel_id=args.video_id,
+        output=output,
+        max_videos=1,
+        debug=getattr(args, "debug", False),
+        format=format_arg,
+    )
+    return EXIT_SUCCESS
+
+
+def _run_comments(args: argparse.Namespace, config: dict[str, Any]) -> int:
+    base_dir = config.get("output_dir", "data")
+    sort = args.sort or config.get("comment_sort", "recent")
+    language = args.language or config.get("language", "en")
+    format_arg = getattr(args, "format", "jsonl")
+    
+    output = args.output or video_comments_path(args.video_id, base_dir=base_dir, format=format_arg)
+    from ytce.pipelines.video_comments import run as run_video_comments
+    run_video_comments(
+        video_id=args.video_id,
+        output=output,
+        sort=sort,
+        limit=args.limit,
+        language=language,
+        format=format_arg,
+    )
+    return EXIT_SUCCESS
+
+
+def _run_batch(args: argparse.Namespace, config: dict[str, Any]) -> int:
+    base_dir = config.get("output_dir", "data")
+    # Merge config with args
+    sort = args.sort or config.get("comment_sort", "recent")
+    language = args.language or config.get("language", "en")
+    format_arg = getattr(args, "format", "json")
+    
+    # For batch command, format applies to both videos and comments
+    comment_format = comments_format(format_arg)
+    
+    # Determine base directory
+    batch_base_dir = args.out_dir or base_dir
+    
+    from ytce.pipelines.batch import run_batch
+    run_batch(
+        channels_file=args.channels_file,
+        base_dir=batch_base_dir,
+        max_videos=args.limit,
+        per_video_limit=args.per_video_limit,
+        sort=sort,
+        language=language,
+        format=comment_format,
+        debug=getattr(args, "debug", False),
+        fail_fast=args.fail_fast,
+        dry_run=args.dry_run,
+        sleep_between=args.sleep_between,
+    )
+    return EXIT_SUCCESS
+
+
 def main(argv: Optional[list[str]] = None) -> int:
     """
     Main entry point for ytce CLI.
@@ -198,166 +413,20 @@ def main(argv: Optional[list[str]] = None) -> int:
         Exit code (0 for success, 1-3 for errors)
     """
     try:
-        parser = build_parser()
+        # No recognised command means argparse will only print help or an
+        # error, for which help-line stubs are enough
+        only = _sniff_subcommand(argv)
+        parser = build_parser(only, stubs=only is None)
         args = parser.parse_args(argv)
 
-        # Determine if debug mode
-        debug = getattr(args, "debug", False)
-
-        # Load config
-        config = load_config()
-        base_dir = config.get("output_dir", "data")
-
-        # ytce init
-        if args.cmd == "init":
-            init_project(args.output_dir)
-            return EXIT_SUCCESS
-
-        # ytce open
-        if args.cmd == "open":
-            # Try to determine if it's a channel or video
-            identifier = args.identifier
-            # Try channel first
-            channel_dir = channel_output_dir(identifier, base_dir=base_dir)
-            if os.path.exists(channel_dir):
-                open_directory(channel_dir)
-                return EXIT_SUCCESS
-            # Try video
-            video_dir = os.path.join(base_dir, identifier)
-            if os.path.exists(video_dir):
-                open_directory(video_dir)
-                return EXIT_SUCCESS
-            # Not found
-            print_error(f"No data found for: {identifier}")
-            print_error(f"Searched in: {base_dir}")
-            from ytce.errors import EXIT_USER_ERROR
-            return EXIT_USER_ERROR
-
-        # ytce channel
-        if args.cmd == "channel":
-            # Merge config with args
-            sort = args.sort or config.get("comment_sort", "recent")
-            language = args.language or config.get("language", "en")
-            dry_run = getattr(args, "dry_run", False)
-            format_arg = getattr(args, "format", "json")
-            
-            # For channel command, format applies to both videos and comments
-            if format_arg == "csv":
-                comment_format = "csv"
-            elif format_arg == "parquet":
-                comment_format = "parquet"
-            else:
-                comment_format = "jsonl"
-            
-            if args.videos_only:
-                # Only download videos metadata (use legacy pipeline)
-                out_dir = args.out_dir or channel_output_dir(args.channel_id, base_dir=base_dir)
-                if format_arg == "csv":
-                    output = os.path.join(out_dir, "videos.csv")
-                elif format_arg == "parquet":
-                    output = os.path.join(out_dir, "videos.parquet")
-                else:
-                    output = os.path.join(out_dir, "videos.json")
-                run_channel_videos(
-                    channel_id=args.channel_id,
-                    output=output,
-                    max_videos=args.limit,
-                    debug=debug,
-                    format=format_arg,
-                )
-            else:
-                # Download videos + comments (use new refactored scraper)
-                scrape_config = ScrapeConfig(
-                    channel_id=args.channel_id,
-                    out_dir=args.out_dir,
-                    base_dir=base_dir,
-                    max_videos=args.limit,
-                    per_video_limit=args.per_video_limit,
-                    sort=sort,
-                    language=language,
-                    format=comment_format,
-                    debug=debug,
-                    videos_only=False,
-                    dry_run=dry_run,
-                    quiet=False,
-                )
-                scrape_channel(scrape_config)
-            return EXIT_SUCCESS
+        # Load config; `init` writes a fresh one and never reads it
+        config: dict[str, Any] = {}
+        if args.cmd != "init":
+            from ytce.config import load_config
+            config = load_config()
 
-        # ytce video
-        if args.cmd == "video":
-            format_arg = getattr(args, "format", "json")
-            if args.output:
-                output = args.output
-            else:
-                if format_arg == "csv":
-                    output = channel_videos_path_with_format(args.video_id, base_dir=base_dir, format="csv")
-                elif format_arg == "parquet":
-                    output = channel_videos_path_with_format(args.video_id, base_dir=base_dir, format="parquet")
-                else:
-                    output = channel_videos_path(args.video_id, base_dir=base_dir)
-            # For single video, we'll just create a minimal videos.json/csv
-            run_channel_videos(
-                channel_id=args.video_id,
-                output=output,
-                max_videos=1,
-                debug=debug,
-                format=format_arg,
-            )
-            return EXIT_SUCCESS
-
-        # ytce comments
-        if args.cmd == "comments":
-            sort = args.sort or config.get("comment_sort", "recent")
-            language = args.language or config.get("language", "en")
-            format_arg = getattr(args, "format", "jsonl")
-            
-            output = args.output or video_comments_path(args.video_id, base_dir=base_dir, format=format_arg)
-            run_video_comments(
-                video_id=args.video_id,
-                output=output,
-                sort=sort,
-                limit=args.limit,
-                language=language,
-                format=format_arg,
-            )
-            return EXIT_SUCCESS
-
-        # ytce batch
-        if args.cmd == "batch":
-            # Merge config with args
-            sort = args.sort or config.get("comment_sort", "recent")
-            language = args.language or config.get("language", "en")
-            format_arg = getattr(args, "format", "json")
-            
-            # For batch command, format applies to both videos and comments
-            if format_arg == "csv":
-                comment_format = "csv"
-            elif format_arg == "parquet":
-                comment_format = "parquet"
-            else:
-                comment_format = "jsonl"
-            
-            # Determine base directory
-            batch_base_dir = args.out_dir or base_dir
-            
-            run_batch(
-                channels_file=args.channels_file,
-                base_dir=batch_base_dir,
-                max_videos=args.limit,
-                per_video_limit=args.per_video_limit,
-                sort=sort,
-                language=language,
-                format=comment_format,
-                debug=debug,
-                fail_fast=args.fail_fast,
-                dry_run=args.dry_run,
-                sleep_between=args.sleep_between,
-            )
-            return EXIT_SUCCESS
-
-        # Should never reach here
-        return EXIT_SUCCESS
+        # Each subparser registers its handler via set_defaults(func=...)
+        return args.func(args, config)
 
     except KeyboardInterrupt:
         # User interrupted - exit gracefully
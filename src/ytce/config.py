@@ -3,11 +3,19 @@
 from __future__ import annotations
 
 import os
+from functools import lru_cache
 from typing import Any, Optional
 
 try:
     import yaml
     HAS_YAML = True
+    # Prefer the libyaml C parser/emitter; fall back to the pure-Python ones
+    try:
+        from yaml import CSafeDumper as _YamlDumper
+        from yaml import CSafeLoader as _YamlLoader
+    except ImportError:
+        from yaml import SafeDumper as _YamlDumper
+        from yaml import SafeLoader as _YamlLoader
 except ImportError:
     HAS_YAML = False
 
@@ -42,7 +50,9 @@ def load_config(config_path: Optional[str] = None) -> dict[str, Any]:
     """Load configuration from ytce.yaml or return defaults."""
     path = config_path or CONFIG_FILE
     
-    if not os.path.exists(path):
+    try:
+        st = os.stat(path)
+    except OSError:
         return DEFAULT_CONFIG.copy()
     
     if not HAS_YAML:
@@ -50,10 +60,9 @@ def load_config(config_path: Optional[str] = None) -> dict[str, Any]:
         return DEFAULT_CONFIG.copy()
     
     try:
-        with open(path, "r", encoding="utf-8") as f:
-            user_config = yaml.safe_load(f) or {}
+        user_config = _read_user_config(os.path.abspath(path), st.st_mtime_ns, st.st_size)
         
-        # Merge with defaults
+        # Merge with defaults (always a fresh dict; the cached parse is shared)
         config = DEFAULT_CONFIG.copy()
         config.update(user_config)
         return config
@@ -62,21 +71,45 @@ def load_config(config_path: Optional[str] = None) -> dict[str, Any]:
         return DEFAULT_CONFIG.copy()
 
 
-def save_config(config: dict[str, Any], config_path: Optional[str] = None) -> None:
-    """Save configuration to ytce.yaml."""
+@lru_cache(maxsize=32)
+def _read_user_config(path: str, mtime_ns: int, size: int) -> Any:
+    """
+    Parse a YAML config file. Cached per (path, mtime, size) so an edited
+    file is re-read automatically; callers must not mutate the result.
+    """
+    # Binary handle: the YAML reader detects the UTF-8/UTF-16 encoding itself
+    with open(path, "rb") as f:
+        return yaml.load(f, Loader=_YamlLoader) or {}
+
+
+def save_config(
+    config: dict[str, Any],
+    config_path: Optional[str] = None,
+    *,
+    exclusive: bool = False,
+) -> None:
+    """
+    Save configuration to ytce.yaml.
+    
+    Args:
+        config: Configuration to write
+        config_path: Target file (default: ./ytce.yaml)
+        exclusive: Raise FileExistsError instead of overwriting an existing file
+    """
     path = config_path or CONFIG_FILE
+    mode = "x" if exclusive else "w"
     
     if not HAS_YAML:
         # Fallback: write as simple key=value format
-        with open(path, "w", encoding="utf-8") as f:
+        with open(path, mode, encoding="utf-8") as f:
             f.write("# ytce configuration\n")
             f.write("# Note: PyYAML not installed. Using simple format.\n\n")
             for key, value in config.items():
                 f.write(f"{key}: {value}\n")
         return
     
-    with open(path, "w", encoding="utf-8") as f:
-        yaml.dump(config, f, default_flow_style=False, sort_keys=False)
+    with open(path, mode, encoding="utf-8") as f:
+        yaml.dump(config, f, Dumper=_YamlDumper, default_flow_style=False, sort_keys=False)
 
 
 def init_project(output_dir: Optional[str] = None) -> None:
@@ -90,19 +123,20 @@ def init_project(output_dir: Optional[str] = None) -> None:
     data_dir = config["output_dir"]
     os.makedirs(data_dir, exist_ok=True)
     
-    # Save config file (if it doesn't exist)
-    if not os.path.exists(CONFIG_FILE):
-        save_config(config)
+    # Save config file (if it doesn't exist); "x" mode checks and creates
+    # in one step, so an existing file is never overwritten
+    try:
+        save_config(config, exclusive=True)
         print(f"✔ Config file: ./{CONFIG_FILE}")
-    else:
+    except FileExistsError:
         print(f"⚠️  Config file already exists: ./{CONFIG_FILE}")
     
     # Create channels.txt template (if it doesn't exist)
-    if not os.path.exists(CHANNELS_FILE):
-        with open(CHANNELS_FILE, "w", encoding="utf-8") as f:
+    try:
+        with open(CHANNELS_FILE, "x", encoding="utf-8") as f:
             f.write(CHANNELS_TEMPLATE)
         print(f"✔ Channels file: ./{CHANNELS_FILE}")
-    else:
+    except FileExistsError:
         print(f"⚠️  Channels file already exists: ./{CHANNELS_FILE}")
     
     # Success messages
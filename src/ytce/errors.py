@@ -5,6 +5,8 @@ from __future__ import annotations
 import sys
 from typing import Optional
 
+from ytce.utils.progress import print_error, print_warning
+
 # Exit codes
 EXIT_SUCCESS = 0
 EXIT_USER_ERROR = 1
@@ -52,8 +54,6 @@ def handle_error(error: Exception, debug: bool = False) -> int:
     Returns:
         Exit code (1, 2, or 3)
     """
-    from ytce.utils.progress import print_error, print_warning
-    
     if isinstance(error, YtceError):
         print_error(f"Failed: {error.message}")
         if error.hint:
@@ -77,7 +77,7 @@ def handle_error(error: Exception, debug: bool = False) -> int:
         print_error(f"Permission denied: {error}")
         return EXIT_USER_ERROR
     
-    if "KeyError" in str(type(error)) or "AttributeError" in str(type(error)):
+    if isinstance(error, (KeyError, AttributeError)):
         print_error("Failed to parse YouTube response")
         print_warning("Reason: YouTube page structure may have changed")
         print_warning("Hint: Try again later or open an issue on GitHub")
@@ -97,8 +97,6 @@ def handle_error(error: Exception, debug: bool = False) -> int:
 
 def exit_with_error(message: str, hint: Optional[str] = None, exit_code: int = EXIT_USER_ERROR) -> None:
     """Print error and exit with code."""
-    from ytce.utils.progress import print_error, print_warning
-    
     print_error(message)
     if hint:
         print_warning(f"Hint: {hint}")
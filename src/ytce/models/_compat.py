@@ -0,0 +1,8 @@
+from __future__ import annotations
+
+import sys
+from typing import Any, Dict
+
+# dataclass(slots=True) is only available on Python 3.10+; older interpreters
+# fall back to regular (dict-backed) dataclasses.
+DATACLASS_SLOTS: Dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
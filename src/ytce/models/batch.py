@@ -3,8 +3,10 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Literal, Optional
 
+from ytce.models._compat import DATACLASS_SLOTS
 
-@dataclass
+
+@dataclass(**DATACLASS_SLOTS)
 class ChannelStats:
     """Statistics from scraping a single channel."""
     
@@ -26,7 +28,7 @@ class ChannelStats:
         )
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class BatchReport:
     """Summary report for batch scraping."""
     
@@ -117,7 +117,7 @@ def run_batch(
             if stats_list:
                 finished_at = datetime.now(timezone.utc)
                 report = _create_batch_report(started_at, finished_at, stats_list, channels)
-                _write_batch_report(batch_dir, started_at, stats_list, channels)
+                _write_batch_report(batch_dir, report)
                 _print_final_summary(report)
                 print_success(f"Partial results saved to: {batch_dir}/")
             return None  # Signal interruption
@@ -150,7 +150,7 @@ def run_batch(
     report = _create_batch_report(started_at, finished_at, stats_list, channels)
     
     # Write report
-    _write_batch_report(batch_dir, started_at, stats_list, channels)
+    _write_batch_report(batch_dir, report)
     
     # Print final summary
     _print_final_summary(report)
@@ -166,18 +166,18 @@ def _create_batch_report(
     stats_list: List[ChannelStats],
     all_channels: List[str],
 ) -> BatchReport:
-    """Create batch report from stats."""
-    channels_ok = sum(1 for s in stats_list if s.status == "ok")
-    channels_failed = len(stats_list) - channels_ok
-    
-    total_videos = sum(s.videos for s in stats_list if s.status == "ok")
-    total_comments = sum(s.comments for s in stats_list if s.status == "ok")
-    total_bytes_mb = sum(s.bytes_mb for s in stats_list if s.status == "ok")
-    total_duration = (finished_at - started_at).total_seconds()
-    
+    """Create batch report from stats (single pass over the channel stats)."""
+    channels_ok = 0
+    total_videos = 0
+    total_comments = 0
+    total_bytes_mb = 0.0
     stats_dicts = []
     for s in stats_list:
         if s.status == "ok":
+            channels_ok += 1
+            total_videos += s.videos
+            total_comments += s.comments
+            total_bytes_mb += s.bytes_mb
             stats_dicts.append({
                 "channel": s.channel,
                 "videos": s.videos,
@@ -192,6 +192,8 @@ def _create_batch_report(
                 "status": "failed",
                 "error": s.error,
             })
+    channels_failed = len(stats_list) - channels_ok
+    total_duration = (finished_at - started_at).total_seconds()
     
     return BatchReport(
         started_at=started_at.isoformat(),
@@ -207,16 +209,8 @@ def _create_batch_report(
     )
 
 
-def _write_batch_report(
-    batch_dir: str,
-    started_at: datetime,
-    stats_list: List[ChannelStats],
-    all_channels: List[str],
-) -> None:
+def _write_batch_report(batch_dir: str, report: BatchReport) -> None:
     """Write batch report to JSON file."""
-    finished_at = datetime.now(timezone.utc)
-    report = _create_batch_report(started_at, finished_at, stats_list, all_channels)
-    
     report_path = os.path.join(batch_dir, "report.json")
     with open(report_path, "w", encoding="utf-8") as f:
         json.dump(report.to_dict(), f, indent=2, ensure_ascii=False)
@@ -224,17 +218,18 @@ def _write_batch_report(
 
 def _print_final_summary(report: BatchReport) -> None:
     """Print beautiful final summary."""
-    print()
-    print("━" * 60)
-    print("Batch completed")
-    print("━" * 60)
-    print(f"✔ Channels OK:     {report.channels_ok}")
+    rule = "━" * 60
+    lines = ["", rule, "Batch completed", rule, f"✔ Channels OK:     {report.channels_ok}"]
     if report.channels_failed > 0:
-        print(f"✖ Channels failed: {report.channels_failed}")
-    print(f"📼 Total videos:   {format_number(report.total_videos)}")
-    print(f"💬 Total comments: {format_number(report.total_comments)}")
-    print(f"📦 Total data:     {format_bytes(report.total_bytes_mb * 1024 * 1024)}")
-    print(f"⏱ Total time:     {format_duration(report.total_duration_sec)}")
-    print("━" * 60)
-    print()
+        lines.append(f"✖ Channels failed: {report.channels_failed}")
+    lines += [
+        f"📼 Total videos:   {format_number(report.total_videos)}",
+        f"💬 Total comments: {format_number(report.total_comments)}",
+        f"📦 Total data:     {format_bytes(report.total_bytes_mb * 1024 * 1024)}",
+        f"⏱ Total time:     {format_duration(report.total_duration_sec)}",
+        rule,
+        "",
+    ]
+    # One write (and one flush on a terminal) for the whole block
+    print("\n".join(lines))
 
@@ -3,12 +3,16 @@ from __future__ import annotations
 import os
 import shutil
 import time
+from dataclasses import asdict
 from datetime import datetime, timezone
+from itertools import islice
 from typing import Iterator, Optional
 
+import requests
+
 from ytce.__version__ import __version__
-from ytce.storage.paths import channel_comments_dir, video_comments_filename
-from ytce.storage.writers import ensure_dir, write_csv, write_json, write_jsonl, write_parquet, write_videos_csv, write_videos_parquet
+from ytce.storage.paths import channel_comments_dir, video_comments_filename, videos_format
+from ytce.storage.writers import comment_writer, ensure_dir, get_file_size, videos_writer
 from ytce.utils.progress import (
     ChannelProgressTracker,
     CommentProgressTracker,
@@ -21,6 +25,7 @@ from ytce.utils.progress import (
 )
 from ytce.youtube.channel_videos import YoutubeChannelVideosScraper
 from ytce.youtube.comments import SORT_BY_POPULAR, SORT_BY_RECENT, YoutubeCommentDownloader
+from ytce.youtube.session import make_session
 
 
 def _prepend_item(gen: Iterator, item):
@@ -40,6 +45,38 @@ def run(
     debug: bool,
     dry_run: bool = False,
     format: str = "jsonl",
+) -> None:
+    # One pooled session shared by the channel scraper and comment downloader
+    session = make_session()
+    try:
+        _run(
+            channel_id=channel_id,
+            out_dir=out_dir,
+            max_videos=max_videos,
+            sort=sort,
+            per_video_limit=per_video_limit,
+            language=language,
+            debug=debug,
+            dry_run=dry_run,
+            format=format,
+            session=session,
+        )
+    finally:
+        session.close()
+
+
+def _run(
+    *,
+    channel_id: str,
+    out_dir: str,
+    max_videos: Optional[int],
+    sort: str,
+    per_video_limit: Optional[int],
+    language: Optional[str],
+    debug: bool,
+    dry_run: bool,
+    format: str,
+    session: requests.Session,
 ) -> None:
     # If directory exists, delete it to start fresh
     if os.path.exists(out_dir):
@@ -52,7 +89,7 @@ def run(
 
     # 1) Videos metadata
     print_step(f"Fetching channel: {channel_id}")
-    vs = YoutubeChannelVideosScraper(debug=debug)
+    vs = YoutubeChannelVideosScraper(debug=debug, session=session)
     videos = vs.get_all_videos(channel_id, max_videos=max_videos, show_progress=False)
     print_success(f"Found {format_number(len(videos))} videos")
     
@@ -80,24 +117,18 @@ def run(
         "source": f"ytce/{__version__}",
     }
     
-    if format == "csv":
-        videos_path = os.path.join(out_dir, "videos.csv")
-        write_videos_csv(videos_path, videos_data)
-    elif format == "parquet":
-        videos_path = os.path.join(out_dir, "videos.parquet")
-        write_videos_parquet(videos_path, videos_data)
-    else:
-        videos_path = os.path.join(out_dir, "videos.json")
-        write_json(videos_path, videos_data)
+    videos_path = os.path.join(out_dir, f"videos.{videos_format(format)}")
+    videos_writer(format)(videos_path, videos_data)
     
     # Track videos file size
-    videos_file_size = os.path.getsize(videos_path) if os.path.exists(videos_path) else 0
+    videos_file_size = get_file_size(videos_path)
     
     print()
 
     # 2) Comments per video
-    cd = YoutubeCommentDownloader()
+    cd = YoutubeCommentDownloader(session=session)
     sort_by = SORT_BY_RECENT if sort == "recent" else SORT_BY_POPULAR
+    write_comments = comment_writer(format)
     
     print_step("Processing videos")
     
@@ -145,30 +176,24 @@ def run(
                     expected_total=expected_total,
                 )
 
-                def limited():
-                    count = 0
-                    for c in gen:
+                def annotated(source):
+                    for c in source:
                         # Skip metadata items
                         if isinstance(c, dict) and "_total_count" in c:
                             continue
                         # Add metadata to each comment
-                        comment_data = dict(c) if isinstance(c, dict) else c.__dict__
+                        # Each comment dict is freshly built by the downloader; annotate it in place
+                        comment_data = c if isinstance(c, dict) else asdict(c)
                         comment_data["scraped_at"] = scraped_at
                         comment_data["source"] = f"ytce/{__version__}"
                         yield comment_data
-                        count += 1
-                        if per_video_limit is not None and count >= per_video_limit:
-                            break
-
-                if format == "csv":
-                    # Use progress callback for real-time updates
-                    wrote = write_csv(out_path, limited(), progress_callback=progress_tracker.update)
-                elif format == "parquet":
-                    # For Parquet, also track progress
-                    wrote = write_parquet(out_path, limited(), progress_callback=progress_tracker.update)
-                else:
-                    # For JSONL, also track progress
-                    wrote = write_jsonl(out_path, limited(), progress_callback=progress_tracker.update)
+
+                comments = annotated(gen)
+                if per_video_limit is not None:
+                    comments = islice(comments, per_video_limit)
+
+                # Use progress callback for real-time updates
+                wrote = write_comments(out_path, comments, progress_callback=progress_tracker.update)
                 
                 # Calculate elapsed time for this video
                 video_elapsed = time.time() - video_start_time
@@ -177,7 +202,7 @@ def run(
                 progress_tracker.finish(wrote)
                 
                 # Get file size
-                file_size = os.path.getsize(out_path) if os.path.exists(out_path) else 0
+                file_size = get_file_size(out_path)
                 
                 # Update channel tracker
                 channel_tracker.video_completed(order, wrote, video_elapsed, file_size)
@@ -4,7 +4,7 @@ from datetime import datetime, timezone
 from typing import Optional
 
 from ytce.__version__ import __version__
-from ytce.storage.writers import write_json, write_videos_csv, write_videos_parquet
+from ytce.storage.writers import videos_writer
 from ytce.utils.progress import format_number, print_step, print_success
 from ytce.youtube.channel_videos import YoutubeChannelVideosScraper
 
@@ -23,11 +23,6 @@ def run(*, channel_id: str, output: str, max_videos: Optional[int], debug: bool,
         "source": f"ytce/{__version__}",
     }
     
-    if format == "csv":
-        write_videos_csv(output, data)
-    elif format == "parquet":
-        write_videos_parquet(output, data)
-    else:
-        write_json(output, data)
+    videos_writer(format)(output, data)
     print_success(f"Found {format_number(len(videos))} videos")
     print_success(f"Saved to {output}")
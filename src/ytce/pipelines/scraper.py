@@ -2,24 +2,21 @@
 from __future__ import annotations
 
 import os
+import queue
 import shutil
+import threading
 import time
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass
 from datetime import datetime, timezone
-from typing import Optional
+from itertools import islice
+from typing import Any, Callable, Dict, Optional, Tuple
+
+import requests
 
 from ytce.__version__ import __version__
 from ytce.models.batch import ChannelStats
-from ytce.storage.paths import channel_comments_dir, channel_output_dir, video_comments_filename
-from ytce.storage.writers import (
-    ensure_dir,
-    write_csv,
-    write_json,
-    write_jsonl,
-    write_parquet,
-    write_videos_csv,
-    write_videos_parquet,
-)
+from ytce.storage.paths import channel_comments_dir, channel_output_dir, video_comments_filename, videos_format
+from ytce.storage.writers import comment_writer, ensure_dir, get_file_size, videos_writer
 from ytce.utils.progress import (
     ChannelProgressTracker,
     CommentProgressTracker,
@@ -32,6 +29,21 @@ from ytce.utils.progress import (
 )
 from ytce.youtube.channel_videos import YoutubeChannelVideosScraper
 from ytce.youtube.comments import SORT_BY_POPULAR, SORT_BY_RECENT, YoutubeCommentDownloader
+from ytce.youtube.session import make_session
+
+# Number of videos whose comments are downloaded concurrently (override with YTCE_WORKERS)
+DEFAULT_WORKERS = 8
+# Seconds between checks of the result queue; an untimed wait cannot be
+# interrupted by Ctrl+C on Windows
+RESULT_POLL_INTERVAL = 0.5
+
+
+def default_workers() -> int:
+    """Return the comment download worker count from YTCE_WORKERS or the default."""
+    try:
+        return max(1, int(os.environ.get("YTCE_WORKERS", DEFAULT_WORKERS)))
+    except ValueError:
+        return DEFAULT_WORKERS
 
 
 @dataclass
@@ -50,6 +62,100 @@ class ScrapeConfig:
     videos_only: bool = False
     dry_run: bool = False
     quiet: bool = False  # For batch mode
+    workers: Optional[int] = None  # Concurrent comment downloads (None = YTCE_WORKERS or default)
+
+
+def _download_one(
+    video: Dict[str, Any],
+    cd_factory: Callable[[], YoutubeCommentDownloader],
+    *,
+    config: ScrapeConfig,
+    comments_prefix: str,
+    sort_by: int,
+    total_videos: int,
+    live_progress: bool,
+    stop: threading.Event,
+    running: threading.Event,
+) -> Tuple[int, float, int]:
+    """
+    Download and write comments for a single video.
+    
+    Runs inside a worker thread; `cd_factory` must return a downloader owned by
+    the calling thread. `comments_prefix` is the (already created) comments
+    directory followed by a path separator. The download waits between
+    comments while `running` is cleared (the quit prompt is showing) and
+    ends early once `stop` is set.
+    
+    Returns:
+        Tuple of (comments written, elapsed seconds, output file size in bytes)
+    """
+    video_id = video["video_id"]
+    order = video.get("order", 0)
+    out_path = comments_prefix + video_comments_filename(order, video_id, format=config.format)
+    
+    video_start_time = time.time()
+    
+    gen = cd_factory().get_comments(video_id, sort_by=sort_by, language=config.language, sleep=0.1)
+    scraped_at = datetime.now(timezone.utc).isoformat()
+    
+    # Extract total comment count from generator
+    total_count = None
+    first_item = next(gen, None)
+    if first_item and isinstance(first_item, dict) and "_total_count" in first_item:
+        total_count = first_item["_total_count"]
+        expected_total = config.per_video_limit if config.per_video_limit is not None else total_count
+    else:
+        expected_total = config.per_video_limit
+        if first_item:
+            def _prepend_item(gen, item):
+                yield item
+                yield from gen
+            gen = _prepend_item(gen, first_item)
+    
+    # Create progress tracker
+    progress_tracker = None
+    if live_progress:
+        progress_tracker = CommentProgressTracker(
+            video_id,
+            order,
+            total_videos,
+            expected_total=expected_total,
+        )
+    
+    def annotated(source):
+        for c in source:
+            running.wait()
+            if stop.is_set():
+                break
+            if isinstance(c, dict) and "_total_count" in c:
+                continue
+            # Each comment dict is freshly built by the downloader; annotate it in place
+            comment_data = c if isinstance(c, dict) else asdict(c)
+            comment_data["scraped_at"] = scraped_at
+            comment_data["source"] = f"ytce/{__version__}"
+            yield comment_data
+
+    comments = annotated(gen)
+    if config.per_video_limit is not None:
+        comments = islice(comments, config.per_video_limit)
+
+    progress_callback = progress_tracker.update if progress_tracker else None
+    
+    # Write comments
+    write_comments = comment_writer(config.format)
+    wrote = write_comments(out_path, comments, progress_callback=progress_callback, skip_mkdir=True)
+    
+    video_elapsed = time.time() - video_start_time
+    
+    # Print progress (not over the quit prompt, nor after the user quit)
+    running.wait()
+    if progress_tracker and not stop.is_set():
+        progress_tracker.finish(wrote)
+    
+    # Get file size
+    file_size = get_file_size(out_path)
+    
+    return wrote, video_elapsed, file_size
 
 
 def scrape_channel(config: ScrapeConfig) -> ChannelStats:
@@ -67,6 +173,15 @@ def scrape_channel(config: ScrapeConfig) -> ChannelStats:
     Raises:
         Exception: On scraping errors (caller should handle)
     """
+    # One pooled session shared by the channel scraper and comment downloads
+    session = make_session()
+    try:
+        return _scrape_channel(config, session)
+    finally:
+        session.close()
+
+
+def _scrape_channel(config: ScrapeConfig, session: requests.Session) -> ChannelStats:
     start_time = time.time()
     
     # Determine output directory
@@ -89,7 +204,7 @@ def scrape_channel(config: ScrapeConfig) -> ChannelStats:
     if not config.quiet:
         print_step(f"Fetching channel: {config.channel_id}")
     
-    vs = YoutubeChannelVideosScraper(debug=config.debug)
+    vs = YoutubeChannelVideosScraper(debug=config.debug, session=session)
     videos = vs.get_all_videos(config.channel_id, max_videos=config.max_videos, show_progress=False)
     
     if not config.quiet:
@@ -123,18 +238,11 @@ def scrape_channel(config: ScrapeConfig) -> ChannelStats:
         "source": f"ytce/{__version__}",
     }
     
-    if config.format == "csv":
-        videos_path = os.path.join(out_dir, "videos.csv")
-        write_videos_csv(videos_path, videos_data)
-    elif config.format == "parquet":
-        videos_path = os.path.join(out_dir, "videos.parquet")
-        write_videos_parquet(videos_path, videos_data)
-    else:
-        videos_path = os.path.join(out_dir, "videos.json")
-        write_json(videos_path, videos_data)
+    videos_path = os.path.join(out_dir, f"videos.{videos_format(config.format)}")
+    videos_writer(config.format)(videos_path, videos_data)
     
     # Track videos file size
-    videos_file_size = os.path.getsize(videos_path) if os.path.exists(videos_path) else 0
+    videos_file_size = get_file_size(videos_path)
     
     # If videos only, return early
     if config.videos_only:
@@ -152,8 +260,10 @@ def scrape_channel(config: ScrapeConfig) -> ChannelStats:
         print()
     
     # 2) Download comments for each video
-    cd = YoutubeCommentDownloader()
     sort_by = SORT_BY_RECENT if config.sort == "recent" else SORT_BY_POPULAR
+    workers = config.workers or default_workers()
+    # Live per-comment progress lines only make sense when one video is in flight
+    live_progress = not config.quiet and workers == 1
     
     if not config.quiet:
         print_step("Processing videos")
@@ -169,120 +279,132 @@ def scrape_channel(config: ScrapeConfig) -> ChannelStats:
     total_comments = 0
     total_bytes = videos_file_size
     
-    idx = 0
-    while idx < len(videos):
-        try:
-            v = videos[idx]
-            video_id = v["video_id"]
-            order = v.get("order", 0)
-            safe_name = video_comments_filename(order, video_id, format=config.format)
-            out_path = os.path.join(comments_dir, safe_name)
-            
+    # requests.Session is not safe for concurrent use, so each worker thread
+    # lazily builds its own downloader. A single worker never runs alongside
+    # another request, so it reuses the already-warm channel session.
+    local = threading.local()
+    stop = threading.Event()
+    # Cleared while the quit prompt is shown so workers (and their live
+    # progress lines) pause instead of drawing over it
+    running = threading.Event()
+    running.set()
+    worker_sessions = []
+    
+    def downloader_factory() -> YoutubeCommentDownloader:
+        downloader = getattr(local, "downloader", None)
+        if downloader is None:
+            if workers == 1:
+                downloader = YoutubeCommentDownloader(session=session)
+            else:
+                downloader = YoutubeCommentDownloader()
+                worker_sessions.append(downloader.session)
+            local.downloader = downloader
+        return downloader
+    
+    comments_prefix = comments_dir + os.sep
+    jobs: "queue.Queue[Dict[str, Any]]" = queue.Queue()
+    for v in videos:
+        jobs.put(v)
+    # One (video, _download_one result or None, error or None) per finished video
+    results: "queue.Queue[Tuple[Dict[str, Any], Any, Optional[Exception]]]" = queue.Queue()
+    
+    def worker() -> None:
+        while not stop.is_set():
             try:
-                video_start_time = time.time()
-                
-                gen = cd.get_comments(video_id, sort_by=sort_by, language=config.language, sleep=0.1)
-                scraped_at = datetime.now(timezone.utc).isoformat()
-                
-                # Extract total comment count from generator
-                total_count = None
-                first_item = next(gen, None)
-                if first_item and isinstance(first_item, dict) and "_total_count" in first_item:
-                    total_count = first_item["_total_count"]
-                    expected_total = config.per_video_limit if config.per_video_limit is not None else total_count
-                else:
-                    expected_total = config.per_video_limit
-                    if first_item:
-                        def _prepend_item(gen, item):
-                            yield item
-                            yield from gen
-                        gen = _prepend_item(gen, first_item)
-                
-                # Create progress tracker
-                if not config.quiet:
-                    progress_tracker = CommentProgressTracker(
-                        video_id,
-                        order,
-                        len(videos),
-                        expected_total=expected_total,
-                    )
-                
-                def limited():
-                    count = 0
-                    for c in gen:
-                        if isinstance(c, dict) and "_total_count" in c:
-                            continue
-                        comment_data = dict(c) if isinstance(c, dict) else c.__dict__
-                        comment_data["scraped_at"] = scraped_at
-                        comment_data["source"] = f"ytce/{__version__}"
-                        yield comment_data
-                        count += 1
-                        if config.per_video_limit is not None and count >= config.per_video_limit:
-                            break
-                
-                # Write comments
-                if config.format == "csv":
-                    wrote = write_csv(
-                        out_path,
-                        limited(),
-                        progress_callback=progress_tracker.update if not config.quiet else None
-                    )
-                elif config.format == "parquet":
-                    wrote = write_parquet(
-                        out_path,
-                        limited(),
-                        progress_callback=progress_tracker.update if not config.quiet else None
-                    )
-                else:
-                    wrote = write_jsonl(
-                        out_path,
-                        limited(),
-                        progress_callback=progress_tracker.update if not config.quiet else None
-                    )
-                
-                video_elapsed = time.time() - video_start_time
-                total_comments += wrote
-                
-                # Print progress
-                if not config.quiet:
-                    progress_tracker.finish(wrote)
-                
-                # Get file size
-                file_size = os.path.getsize(out_path) if os.path.exists(out_path) else 0
-                total_bytes += file_size
-                
-                # Update channel tracker
-                if not config.quiet:
-                    channel_tracker.video_completed(order, wrote, video_elapsed, file_size)
-                    
-                    # Print channel-level statistics
-                    if order % 5 == 0 or order == len(videos):
-                        stats = channel_tracker.get_statistics()
-                        print(f"  📊 {stats}", flush=True)
-            
+                v = jobs.get_nowait()
+            except queue.Empty:
+                return
+            try:
+                outcome = _download_one(
+                    v,
+                    downloader_factory,
+                    config=config,
+                    comments_prefix=comments_prefix,
+                    sort_by=sort_by,
+                    total_videos=len(videos),
+                    live_progress=live_progress,
+                    stop=stop,
+                    running=running,
+                )
             except Exception as e:
-                if "comments disabled" in str(e).lower():
-                    if not config.quiet:
-                        print_video_progress(order, len(videos), video_id, status="comments disabled")
-                else:
+                results.put((v, None, e))
+            else:
+                results.put((v, outcome, None))
+    
+    # Daemon threads: once the user confirms quit we return without waiting
+    # for in-flight HTTP calls (which may sit in timeouts and adapter retries)
+    threads = [
+        threading.Thread(target=worker, name=f"ytce-comments-{i}", daemon=True)
+        for i in range(min(workers, len(videos)))
+    ]
+    for t in threads:
+        t.start()
+    done = 0
+    
+    try:
+        while done < len(videos):
+            try:
+                while done < len(videos):
+                    try:
+                        v, outcome, error = results.get(timeout=RESULT_POLL_INTERVAL)
+                    except queue.Empty:
+                        continue
+                    done += 1
+                    video_id = v["video_id"]
+                    order = v.get("order", 0)
+                    
+                    if error is not None:
+                        if "comments disabled" in str(error).lower():
+                            if not config.quiet:
+                                print_video_progress(order, len(videos), video_id, status="comments disabled")
+                        else:
+                            if not config.quiet:
+                                print_video_progress(order, len(videos), video_id, status=f"error: {error}")
+                            if config.debug:
+                                raise error
+                        continue
+                    
+                    wrote, video_elapsed, file_size = outcome
+                    total_comments += wrote
+                    total_bytes += file_size
+                    
                     if not config.quiet:
-                        print_video_progress(order, len(videos), video_id, status=f"error: {e}")
-                    if config.debug:
-                        raise
+                        if not live_progress:
+                            print_video_progress(order, len(videos), video_id, comment_count=wrote)
+                        
+                        # Update channel tracker
+                        channel_tracker.video_completed(order, wrote, video_elapsed, file_size)
+                        
+                        # Print channel-level statistics
+                        if done % 5 == 0 or done == len(videos):
+                            stats = channel_tracker.get_statistics()
+                            print(f"  📊 {stats}", flush=True)
             
-            idx += 1
-        
-        except KeyboardInterrupt:
-            if not config.quiet and confirm_quit():
-                print()
-                print_warning("Scraping cancelled by user")
-                print_warning(f"Partial data saved to {out_dir}/")
-                raise
-            else:
-                if not config.quiet:
-                    print()
-                    print_success("Continuing scrape...")
+            except KeyboardInterrupt:
+                running.clear()
+                if not config.quiet and confirm_quit():
+                    stop.set()
+                    running.set()
                     print()
+                    print_warning("Scraping cancelled by user")
+                    print_warning(f"Partial data saved to {out_dir}/")
+                    raise
+                else:
+                    if not config.quiet:
+                        print()
+                        print_success("Continuing scrape...")
+                        print()
+                    running.set()
+    finally:
+        # Idle workers exit; in-flight ones stop at their next comment
+        stop.set()
+        running.set()
+    
+    # Every video reported back, so no worker is still using its session
+    for t in threads:
+        t.join()
+    for worker_session in worker_sessions:
+        worker_session.close()
     
     duration = time.time() - start_time
     
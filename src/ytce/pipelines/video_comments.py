@@ -1,11 +1,13 @@
 from __future__ import annotations
 
 import time
+from dataclasses import asdict
 from datetime import datetime, timezone
+from itertools import islice
 from typing import Optional
 
 from ytce.__version__ import __version__
-from ytce.storage.writers import write_csv, write_jsonl, write_parquet
+from ytce.storage.writers import comment_writer
 from ytce.utils.progress import CommentProgressTracker, format_number, print_step, print_success
 from ytce.youtube.comments import SORT_BY_POPULAR, SORT_BY_RECENT, YoutubeCommentDownloader
 
@@ -45,28 +47,24 @@ def run(
     # Create progress tracker for real-time updates with expected total
     progress_tracker = CommentProgressTracker(video_id, 1, 1, expected_total=expected_total)
 
-    def limited():
-        nonlocal gen
-        count = 0
-        for c in gen:
+    def annotated(source):
+        for c in source:
             # Skip metadata items
             if isinstance(c, dict) and "_total_count" in c:
                 continue
             # Add metadata to each comment
-            comment_data = dict(c) if isinstance(c, dict) else c.__dict__
+            # Each comment dict is freshly built by the downloader; annotate it in place
+            comment_data = c if isinstance(c, dict) else asdict(c)
             comment_data["scraped_at"] = scraped_at
             comment_data["source"] = f"ytce/{__version__}"
             yield comment_data
-            count += 1
-            if limit is not None and count >= limit:
-                break
 
-    if format == "csv":
-        wrote = write_csv(output, limited(), progress_callback=progress_tracker.update)
-    elif format == "parquet":
-        wrote = write_parquet(output, limited(), progress_callback=progress_tracker.update)
-    else:
-        wrote = write_jsonl(output, limited(), progress_callback=progress_tracker.update)
+    comments = annotated(gen)
+    if limit is not None:
+        comments = islice(comments, limit)
+
+    write_comments = comment_writer(format)
+    wrote = write_comments(output, comments, progress_callback=progress_tracker.update)
     
     # Print final progress
     progress_tracker.finish(wrote)
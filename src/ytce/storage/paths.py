@@ -4,18 +4,27 @@ import os
 
 from ytce.utils.helpers import sanitize_name
 
+# Output format -> file extension; anything else falls back to JSONL / JSON
+_COMMENTS_EXT = {"csv": "csv", "parquet": "parquet"}
+_VIDEOS_EXT = {"csv": "csv", "parquet": "parquet"}
+
+
+def comments_format(format: str) -> str:
+    """Map an output format to the comments file format ("json" and unknown -> "jsonl")."""
+    return _COMMENTS_EXT.get(format, "jsonl")
+
+
+def videos_format(format: str) -> str:
+    """Map an output format to the videos file format (unknown -> "json")."""
+    return _VIDEOS_EXT.get(format, "json")
+
 
 def channel_videos_path(channel_id: str, base_dir: str = "data") -> str:
     return os.path.join(base_dir, sanitize_name(channel_id), "videos.json")
 
 
 def video_comments_path(video_id: str, base_dir: str = "data", format: str = "jsonl") -> str:
-    if format == "csv":
-        ext = "csv"
-    elif format == "parquet":
-        ext = "parquet"
-    else:
-        ext = "jsonl"
+    ext = comments_format(format)
     return os.path.join(base_dir, sanitize_name(video_id), f"comments.{ext}")
 
 
@@ -28,21 +37,11 @@ def channel_comments_dir(out_dir: str) -> str:
 
 
 def video_comments_filename(order: int, video_id: str, format: str = "jsonl") -> str:
-    if format == "csv":
-        ext = "csv"
-    elif format == "parquet":
-        ext = "parquet"
-    else:
-        ext = "jsonl"
+    ext = comments_format(format)
     return f"{order:04d}_{video_id}.{ext}"
 
 
 def channel_videos_path_with_format(channel_id: str, base_dir: str = "data", format: str = "json") -> str:
     """Get path for channel videos file with specified format."""
-    if format == "csv":
-        ext = "csv"
-    elif format == "parquet":
-        ext = "parquet"
-    else:
-        ext = "json"
+    ext = videos_format(format)
     return os.path.join(base_dir, sanitize_name(channel_id), f"videos.{ext}")
@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 import csv
-import io
 import json
 import os
 from typing import Any, Callable, Dict, Iterable, List, Optional
@@ -13,13 +12,43 @@ try:
 except ImportError:
     HAS_PARQUET = False
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+
+WRITE_BUFFER_SIZE = 1024 * 1024  # 1 MiB file buffer for streamed output
+WRITE_BATCH_SIZE = 64 * 1024  # Flush encoded JSONL lines in ~64 KiB batches
+PARQUET_ROW_GROUP_SIZE = 50_000  # Rows buffered per Parquet row group
+
+
+def _dumps_line(item: Any) -> bytes:
+    """Encode one JSONL record (UTF-8, trailing newline)."""
+    if HAS_ORJSON:
+        return orjson.dumps(item, option=orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(item, ensure_ascii=False) + "\n").encode("utf-8")
+
 
 def ensure_dir(path: str) -> None:
     os.makedirs(path, exist_ok=True)
 
 
+def get_file_size(path: str) -> int:
+    """Return the size of `path` in bytes, or 0 if it does not exist (one stat call)."""
+    try:
+        return os.stat(path).st_size
+    except OSError:
+        return 0
+
+
 def write_json(path: str, payload: Any) -> None:
     ensure_dir(os.path.dirname(path) or ".")
+    if HAS_ORJSON:
+        with open(path, "wb") as f:
+            f.write(orjson.dumps(payload, option=orjson.OPT_INDENT_2))
+        return
     with open(path, "w", encoding="utf-8") as f:
         json.dump(payload, f, indent=2, ensure_ascii=False)
 
@@ -28,15 +57,36 @@ def write_jsonl(
     path: str, 
     items: Iterable[Dict[str, Any]], 
     progress_callback: Optional[Callable[[int], None]] = None,
+    skip_mkdir: bool = False,
 ) -> int:
-    ensure_dir(os.path.dirname(path) or ".")
+    if not skip_mkdir:
+        ensure_dir(os.path.dirname(path) or ".")
     count = 0
-    with io.open(path, "w", encoding="utf-8") as f:
-        for item in items:
-            f.write(json.dumps(item, ensure_ascii=False) + "\n")
-            count += 1
-            if progress_callback:
-                progress_callback(count)
+    # Encoded lines are batched and handed to a large file buffer so each
+    # write() syscall carries many comments instead of one.
+    pending: List[bytes] = []
+    pending_bytes = 0
+    # Bind hot-loop callables to locals to skip global/attribute lookups
+    dumps_line = _dumps_line
+    append = pending.append
+    with open(path, "wb", buffering=WRITE_BUFFER_SIZE) as f:
+        writelines = f.writelines
+        try:
+            for item in items:
+                line = dumps_line(item)
+                append(line)
+                pending_bytes += len(line)
+                if pending_bytes >= WRITE_BATCH_SIZE:
+                    writelines(pending)
+                    pending.clear()
+                    pending_bytes = 0
+                count += 1
+                if progress_callback:
+                    progress_callback(count)
+        finally:
+            # Keep already-scraped comments even if the source iterator fails
+            if pending:
+                f.writelines(pending)
     return count
 
 
@@ -45,6 +95,7 @@ def write_csv(
     items: Iterable[Dict[str, Any]], 
     fieldnames: Optional[List[str]] = None,
     progress_callback: Optional[Callable[[int], None]] = None,
+    skip_mkdir: bool = False,
 ) -> int:
     """
     Write items to a CSV file in streaming fashion (writes as items come in).
@@ -54,11 +105,13 @@ def write_csv(
         items: Iterable of dictionaries to write
         fieldnames: Optional list of field names (if None, inferred from first item)
         progress_callback: Optional callback function(count) called after each item is written
+        skip_mkdir: Skip creating the parent directory (caller guarantees it exists)
     
     Returns:
         Number of rows written (excluding header)
     """
-    ensure_dir(os.path.dirname(path) or ".")
+    if not skip_mkdir:
+        ensure_dir(os.path.dirname(path) or ".")
     count = 0
     
     # Peek at first item to determine fieldnames if needed
@@ -176,6 +229,7 @@ def write_parquet(
     path: str, 
     items: Iterable[Dict[str, Any]], 
     progress_callback: Optional[Callable[[int], None]] = None,
+    skip_mkdir: bool = False,
 ) -> int:
     """
     Write items to a Parquet file in streaming fashion (writes as items come in).
@@ -184,6 +238,7 @@ def write_parquet(
         path: Output file path
         items: Iterable of dictionaries to write
         progress_callback: Optional callback function(count) called after each item is written
+        skip_mkdir: Skip creating the parent directory (caller guarantees it exists)
     
     Returns:
         Number of rows written
@@ -197,31 +252,109 @@ def write_parquet(
             "Install it with: pip install pyarrow"
         )
     
-    ensure_dir(os.path.dirname(path) or ".")
+    if not skip_mkdir:
+        ensure_dir(os.path.dirname(path) or ".")
     
-    # Collect items into a list (required for PyArrow)
-    items_list = []
+    # Convert and write one row group at a time so memory stays bounded by
+    # PARQUET_ROW_GROUP_SIZE rather than the total number of comments.
+    batch: List[Dict[str, Any]] = []
+    writer = None
     count = 0
-    for item in items:
-        items_list.append(item)
-        count += 1
-        if progress_callback:
-            progress_callback(count)
+    try:
+        for item in items:
+            batch.append(item)
+            count += 1
+            if progress_callback:
+                progress_callback(count)
+            if len(batch) >= PARQUET_ROW_GROUP_SIZE:
+                writer = _write_parquet_batch(writer, path, batch)
+                batch = []
+        if batch:
+            writer = _write_parquet_batch(writer, path, batch)
+    finally:
+        if writer is not None:
+            writer.close()
     
-    if not items_list:
+    if writer is None:
         # Create empty parquet file
         schema = pa.schema([])
         table = pa.table({}, schema=schema)
         pq.write_table(table, path)
         return 0
     
-    # Convert to PyArrow table and write
-    table = pa.Table.from_pylist(items_list)
-    pq.write_table(table, path, compression='snappy')
-    
     return count
 
 
+def _write_parquet_batch(writer: Any, path: str, batch: List[Dict[str, Any]]) -> Any:
+    """
+    Append a batch as a row group, opening the writer on first use.
+    
+    Each batch's schema is inferred on its own. If it differs from the file
+    schema (a column that was all-None so far, or a key first seen in this
+    batch), the schemas are unified and rows already written are rewritten
+    with the wider schema. Returns the writer to use for the next batch.
+    """
+    table = pa.Table.from_pylist(batch)
+    if writer is None:
+        return _open_parquet_writer(path, table)
+    if not table.schema.equals(writer.schema):
+        schema = _unify_parquet_schemas(writer.schema, table.schema)
+        if not schema.equals(writer.schema):
+            writer = _rewrite_parquet(writer, path, schema)
+        table = _conform_table(table, schema)
+    writer.write_table(table)
+    return writer
+
+
+def _open_parquet_writer(path: str, table: Any) -> Any:
+    writer = pq.ParquetWriter(path, table.schema, compression='snappy')
+    writer.write_table(table)
+    return writer
+
+
+def _unify_parquet_schemas(current: Any, incoming: Any) -> Any:
+    """Merge two batch schemas, promoting types (null -> T, int -> float) where possible."""
+    try:
+        try:
+            return pa.unify_schemas([current, incoming], promote_options="permissive")
+        except TypeError as e:
+            if isinstance(e, pa.ArrowException):
+                raise
+            # pyarrow < 14 has no promote_options; it only merges null-typed fields
+            return pa.unify_schemas([current, incoming])
+    except pa.ArrowException as e:
+        raise ValueError(f"Cannot write Parquet: column types changed between row groups ({e})") from e
+
+
+def _conform_table(table: Any, schema: Any) -> Any:
+    """Reorder/cast `table` to `schema`, filling columns it lacks with nulls."""
+    columns = [
+        table.column(field.name).cast(field.type)
+        if field.name in table.column_names
+        else pa.nulls(table.num_rows, field.type)
+        for field in schema
+    ]
+    return pa.Table.from_arrays(columns, schema=schema)
+
+
+def _rewrite_parquet(writer: Any, path: str, schema: Any) -> Any:
+    """Close `writer` and copy the row groups written so far into a new file with `schema`."""
+    writer.close()
+    old_path = path + ".old"
+    os.replace(path, old_path)
+    new_writer = pq.ParquetWriter(path, schema, compression='snappy')
+    try:
+        with open(old_path, "rb") as f:
+            written = pq.ParquetFile(f)
+            for i in range(written.num_row_groups):
+                new_writer.write_table(_conform_table(written.read_row_group(i), schema))
+    except BaseException:
+        new_writer.close()
+        raise
+    os.remove(old_path)
+    return new_writer
+
+
 def write_videos_parquet(path: str, videos_data: Dict[str, Any]) -> int:
     """
     Write videos metadata to Parquet format.
@@ -257,3 +390,24 @@ def write_videos_parquet(path: str, videos_data: Dict[str, Any]) -> int:
     pq.write_table(table, path, compression='snappy')
     
     return len(videos)
+
+
+# Output format -> writer; anything else falls back to JSONL / JSON
+_COMMENT_WRITERS: Dict[str, Callable[..., int]] = {
+    "csv": write_csv,
+    "parquet": write_parquet,
+}
+_VIDEOS_WRITERS: Dict[str, Callable[[str, Dict[str, Any]], Any]] = {
+    "csv": write_videos_csv,
+    "parquet": write_videos_parquet,
+}
+
+
+def comment_writer(format: str) -> Callable[..., int]:
+    """Return the streaming comments writer for an output format (default: JSONL)."""
+    return _COMMENT_WRITERS.get(format, write_jsonl)
+
+
+def videos_writer(format: str) -> Callable[[str, Dict[str, Any]], Any]:
+    """Return the videos metadata writer for an output format (default: JSON)."""
+    return _VIDEOS_WRITERS.get(format, write_json)
@@ -3,6 +3,11 @@ from __future__ import annotations
 import re
 from typing import List
 
+_HANDLE_URL_RE = re.compile(r'youtube\.com/@([a-zA-Z0-9_-]+)')
+_CHANNEL_URL_RE = re.compile(r'youtube\.com/channel/(UC[a-zA-Z0-9_-]+)')
+_CHANNEL_PATH_RE = re.compile(r'^/?channel/(UC[a-zA-Z0-9_-]+)')
+_CHANNEL_ID_RE = re.compile(r'^UC[a-zA-Z0-9_-]+$')
+
 
 def parse_channels_file(file_path: str) -> List[str]:
     """
@@ -65,22 +70,22 @@ def extract_channel_ref(text: str) -> str | None:
         return text
     
     # Full URL with @handle
-    match = re.search(r'youtube\.com/@([a-zA-Z0-9_-]+)', text)
+    match = _HANDLE_URL_RE.search(text)
     if match:
         return f"@{match.group(1)}"
     
     # Full URL with /channel/UC...
-    match = re.search(r'youtube\.com/channel/(UC[a-zA-Z0-9_-]+)', text)
+    match = _CHANNEL_URL_RE.search(text)
     if match:
         return match.group(1)
     
     # Path format /channel/UC...
-    match = re.search(r'^/?channel/(UC[a-zA-Z0-9_-]+)', text)
+    match = _CHANNEL_PATH_RE.search(text)
     if match:
         return match.group(1)
     
     # Direct channel ID
-    if re.match(r'^UC[a-zA-Z0-9_-]+$', text):
+    if _CHANNEL_ID_RE.match(text):
         return text
     
     return None
@@ -3,6 +3,11 @@ from __future__ import annotations
 import re
 from typing import Optional
 
+_VIEW_RE = re.compile(r"([\d.]+)\s*([KMB]?)", re.IGNORECASE)
+# Separators stripped before matching: spaces, commas, narrow/no-break spaces
+_VIEW_TRANS = str.maketrans("", "", " ,\u202f\xa0")
+_MULT = {"": 1, "K": 1_000, "M": 1_000_000, "B": 1_000_000_000}
+
 
 def parse_view_count(view_count_raw: str) -> Optional[int]:
     """
@@ -14,16 +19,7 @@ def parse_view_count(view_count_raw: str) -> Optional[int]:
     """
     if not view_count_raw:
         return None
-    s = view_count_raw.replace(" ", "").replace(",", "").replace("\u202f", "").replace("\xa0", "")
-    match = re.search(r"([\d.]+)\s*([KMB]?)", s, re.IGNORECASE)
+    match = _VIEW_RE.search(view_count_raw.translate(_VIEW_TRANS))
     if not match:
         return None
-    number = float(match.group(1))
-    mult = (match.group(2) or "").upper()
-    if mult == "K":
-        return int(number * 1_000)
-    if mult == "M":
-        return int(number * 1_000_000)
-    if mult == "B":
-        return int(number * 1_000_000_000)
-    return int(number)
+    return int(float(match.group(1)) * _MULT[match.group(2).upper()])
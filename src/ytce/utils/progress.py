@@ -6,6 +6,17 @@ import sys
 import time
 from typing import Optional
 
+# Shown by confirm_quit(); printed in one write
+_QUIT_WARNING = "\n".join([
+    "\n",
+    "⚠️  STOPPING SCRAPE",
+    "━" * 60,
+    "⚠️  If you quit now and restart the channel download later,",
+    "   ALL existing data will be deleted and re-downloaded from scratch.",
+    "━" * 60,
+    "",
+])
+
 
 def print_step(message: str) -> None:
     """Print a step in progress."""
@@ -34,13 +45,7 @@ def confirm_quit() -> bool:
     Returns:
         True if user wants to quit, False otherwise
     """
-    print("\n")
-    print("⚠️  STOPPING SCRAPE")
-    print("━" * 60)
-    print("⚠️  If you quit now and restart the channel download later,")
-    print("   ALL existing data will be deleted and re-downloaded from scratch.")
-    print("━" * 60)
-    print()
+    print(_QUIT_WARNING)
     
     try:
         response = input("Do you really want to quit? [y/N]: ").strip().lower()
@@ -234,7 +239,6 @@ class ChannelProgressTracker:
         self.total_comments = 0
         self.total_bytes = 0
         self._start_time = time.time()
-        self._video_times = []  # Track time per video for better ETA
     
     def video_started(self, video_index: int) -> None:
         """Called when a video starts processing."""
@@ -245,7 +249,6 @@ class ChannelProgressTracker:
         self.videos_completed += 1
         self.total_comments += comment_count
         self.total_bytes += file_size
-        self._video_times.append(elapsed_time)
     
     def get_eta(self) -> Optional[str]:
         """Calculate ETA for remaining videos."""
@@ -256,12 +259,11 @@ class ChannelProgressTracker:
         if remaining_videos <= 0:
             return None
         
-        # Use average time per video for ETA
-        if self._video_times:
-            avg_time_per_video = sum(self._video_times) / len(self._video_times)
-            eta_seconds = avg_time_per_video * remaining_videos
-            return format_time(eta_seconds)
-        return None
+        # Use wall-clock throughput rather than summed per-video times, which
+        # overstate the ETA when several videos are downloaded concurrently
+        elapsed = time.time() - self._start_time
+        eta_seconds = elapsed / self.videos_completed * remaining_videos
+        return format_time(eta_seconds)
     
     def get_statistics(self) -> str:
         """Get formatted statistics string."""
@@ -20,8 +20,8 @@ class YoutubeChannelVideosScraper:
     Uses YouTube InnerTube API (same mechanism as comments).
     """
 
-    def __init__(self, debug=False):
-        self.session = make_session()
+    def __init__(self, debug=False, session=None):
+        self.session = session if session is not None else make_session()
         self.debug = debug
 
     def get_videos(self, channel_id):
@@ -48,7 +48,7 @@ class YoutubeChannelVideosScraper:
 
         # Find continuation token for pagination
         # Look for the one with the longest token (usually the video continuation)
-        continuation = pick_longest_continuation(list(search_dict(data, "continuationEndpoint")))
+        continuation = pick_longest_continuation(search_dict(data, "continuationEndpoint"))
 
         return {
             "ytcfg": ytcfg,
@@ -156,10 +156,8 @@ class YoutubeChannelVideosScraper:
 
         return all_videos
 
-    def _ajax_request(self, endpoint, ytcfg, retries=5, sleep=20, timeout=60):
-        return inertube_ajax_request(
-            self.session, endpoint, ytcfg, retries=retries, sleep=float(sleep), timeout=timeout
-        )
+    def _ajax_request(self, endpoint, ytcfg, timeout=60):
+        return inertube_ajax_request(self.session, endpoint, ytcfg, timeout=timeout)
 
     def _parse_videos(self, data):
         """
@@ -3,6 +3,7 @@ from __future__ import print_function
 import json
 import re
 import time
+from itertools import chain
 
 from ytce.youtube.extractors import extract_ytcfg, extract_ytinitialdata
 from ytce.youtube.html import fetch_html
@@ -15,16 +16,23 @@ YOUTUBE_VIDEO_URL = "https://www.youtube.com/watch?v={youtube_id}"
 SORT_BY_POPULAR = 0
 SORT_BY_RECENT = 1
 
+_DIGITS_RE = re.compile(r"\d+")
+
+# Continuation targets that hold top-level comment threads
+COMMENT_SECTION_TARGETS = frozenset({
+    "comments-section",
+    "engagement-panel-comments-section",
+    "shorts-engagement-panel-comments-section",
+})
+
 
 class YoutubeCommentDownloader:
 
-    def __init__(self):
-        self.session = make_session()
+    def __init__(self, session=None):
+        self.session = session if session is not None else make_session()
 
-    def ajax_request(self, endpoint, ytcfg, retries=5, sleep=20, timeout=60):
-        return inertube_ajax_request(
-            self.session, endpoint, ytcfg, retries=retries, sleep=float(sleep), timeout=timeout
-        )
+    def ajax_request(self, endpoint, ytcfg, timeout=60):
+        return inertube_ajax_request(self.session, endpoint, ytcfg, timeout=timeout)
 
     def get_comments(self, youtube_id, *args, **kwargs):
         return self.get_comments_from_url(YOUTUBE_VIDEO_URL.format(youtube_id=youtube_id), *args, **kwargs)
@@ -118,12 +126,12 @@ class YoutubeCommentDownloader:
                 if runs:
                     for run in runs:
                         text = run.get("text", "")
-                        if "comment" in text.lower() and any(c.isdigit() for c in text):
+                        if "comment" in text.lower() and _DIGITS_RE.search(text):
                             parsed = self._parse_comment_count(text)
                             if parsed:
                                 return parsed
                 simple_text = text_field.get("simpleText", "")
-                if simple_text and "comment" in simple_text.lower() and any(c.isdigit() for c in simple_text):
+                if simple_text and "comment" in simple_text.lower() and _DIGITS_RE.search(simple_text):
                     parsed = self._parse_comment_count(simple_text)
                     if parsed:
                         return parsed
@@ -166,7 +174,7 @@ class YoutubeCommentDownloader:
                 return int(float(count_str) * multiplier)
         except (ValueError, TypeError):
             # Fallback: try regex to extract any numbers
-            numbers = re.findall(r'\d+', original_str)
+            numbers = _DIGITS_RE.findall(original_str)
             if numbers:
                 try:
                     base_num = float(numbers[0])
@@ -229,45 +237,7 @@ class YoutubeCommentDownloader:
 
         # Process first response if we have it
         if first_response:
-            error = next(search_dict(first_response, "externalErrorMessage"), None)
-            if error:
-                raise RuntimeError("Error returned from server: " + error)
-
-            actions = list(search_dict(first_response, "reloadContinuationItemsCommand")) + \
-                      list(search_dict(first_response, "appendContinuationItemsAction"))
-            for action in actions:
-                for item in action.get("continuationItems", []):
-                    if action["targetId"] in ["comments-section",
-                                              "engagement-panel-comments-section",
-                                              "shorts-engagement-panel-comments-section"]:
-                        # Process continuations for comments and replies.
-                        continuations[:0] = [ep for ep in search_dict(item, "continuationEndpoint")]
-                    if action["targetId"].startswith("comment-replies-item") and "continuationItemRenderer" in item:
-                        # Process the 'Show more replies' button
-                        continuations.append(next(search_dict(item, "buttonRenderer"))["command"])
-
-            toolbar_payloads = search_dict(first_response, "engagementToolbarStateEntityPayload")
-            toolbar_states = {payload["key"]: payload for payload in toolbar_payloads}
-            for comment in reversed(list(search_dict(first_response, "commentEntityPayload"))):
-                properties = comment["properties"]
-                cid = properties["commentId"]
-                author = comment["author"]
-                toolbar = comment["toolbar"]
-                toolbar_state = toolbar_states[properties["toolbarStateKey"]]
-                text_content = properties["content"]["content"]
-                result = {"cid": cid,
-                          "text": text_content,
-                          "text_length": len(text_content),
-                          "time": properties["publishedTime"],
-                          "author": author["displayName"],
-                          "channel": author["channelId"],
-                          "votes": toolbar["likeCountNotliked"].strip() or "0",
-                          "replies": toolbar["replyCount"],
-                          "photo": author["avatarThumbnailUrl"],
-                          "heart": toolbar_state.get("heartState", "") == "TOOLBAR_HEART_STATE_HEARTED",
-                          "reply": "." in cid}
-
-                yield result
+            yield from self._parse_response(first_response, continuations)
             time.sleep(sleep)
 
         while continuations:
@@ -277,45 +247,50 @@ class YoutubeCommentDownloader:
             if not response:
                 break
 
-            error = next(search_dict(response, "externalErrorMessage"), None)
-            if error:
-                raise RuntimeError("Error returned from server: " + error)
+            yield from self._parse_response(response, continuations)
+            time.sleep(sleep)
+
+    def _parse_response(self, response, continuations):
+        """
+        Yield the comments in one InnerTube response, queueing any further
+        continuations (comment pages and 'Show more replies') onto `continuations`.
+        """
+        error = next(search_dict(response, "externalErrorMessage"), None)
+        if error:
+            raise RuntimeError("Error returned from server: " + error)
 
-            actions = list(search_dict(response, "reloadContinuationItemsCommand")) + \
-                      list(search_dict(response, "appendContinuationItemsAction"))
-            for action in actions:
-                for item in action.get("continuationItems", []):
-                    if action["targetId"] in ["comments-section",
-                                              "engagement-panel-comments-section",
-                                              "shorts-engagement-panel-comments-section"]:
-                        # Process continuations for comments and replies.
-                        continuations[:0] = [ep for ep in search_dict(item, "continuationEndpoint")]
-                    if action["targetId"].startswith("comment-replies-item") and "continuationItemRenderer" in item:
-                        # Process the 'Show more replies' button
-                        continuations.append(next(search_dict(item, "buttonRenderer"))["command"])
+        actions = chain(search_dict(response, "reloadContinuationItemsCommand"),
+                        search_dict(response, "appendContinuationItemsAction"))
+        for action in actions:
+            for item in action.get("continuationItems", []):
+                if action["targetId"] in COMMENT_SECTION_TARGETS:
+                    # Process continuations for comments and replies.
+                    continuations[:0] = [ep for ep in search_dict(item, "continuationEndpoint")]
+                if action["targetId"].startswith("comment-replies-item") and "continuationItemRenderer" in item:
+                    # Process the 'Show more replies' button
+                    continuations.append(next(search_dict(item, "buttonRenderer"))["command"])
 
-            toolbar_payloads = search_dict(response, "engagementToolbarStateEntityPayload")
-            toolbar_states = {payload["key"]: payload for payload in toolbar_payloads}
-            for comment in reversed(list(search_dict(response, "commentEntityPayload"))):
-                properties = comment["properties"]
-                cid = properties["commentId"]
-                author = comment["author"]
-                toolbar = comment["toolbar"]
-                toolbar_state = toolbar_states[properties["toolbarStateKey"]]
-                text_content = properties["content"]["content"]
-                result = {"cid": cid,
-                          "text": text_content,
-                          "text_length": len(text_content),
-                          "time": properties["publishedTime"],
-                          "author": author["displayName"],
-                          "channel": author["channelId"],
-                          "votes": toolbar["likeCountNotliked"].strip() or "0",
-                          "replies": toolbar["replyCount"],
-                          "photo": author["avatarThumbnailUrl"],
-                          "heart": toolbar_state.get("heartState", "") == "TOOLBAR_HEART_STATE_HEARTED",
-                          "reply": "." in cid}
+        toolbar_payloads = search_dict(response, "engagementToolbarStateEntityPayload")
+        toolbar_states = {payload["key"]: payload for payload in toolbar_payloads}
+        for comment in reversed(list(search_dict(response, "commentEntityPayload"))):
+            properties = comment["properties"]
+            cid = properties["commentId"]
+            author = comment["author"]
+            toolbar = comment["toolbar"]
+            toolbar_state = toolbar_states[properties["toolbarStateKey"]]
+            text_content = properties["content"]["content"]
+            result = {"cid": cid,
+                      "text": text_content,
+                      "text_length": len(text_content),
+                      "time": properties["publishedTime"],
+                      "author": author["displayName"],
+                      "channel": author["channelId"],
+                      "votes": toolbar["likeCountNotliked"].strip() or "0",
+                      "replies": toolbar["replyCount"],
+                      "photo": author["avatarThumbnailUrl"],
+                      "heart": toolbar_state.get("heartState", "") == "TOOLBAR_HEART_STATE_HEARTED",
+                      "reply": "." in cid}
 
-                yield result
-            time.sleep(sleep)
+            yield result
 
     # NOTE: ytce.youtube.pagination.search_dict is used; do not re-implement here.
@@ -2,7 +2,13 @@ from __future__ import annotations
 
 import json
 import re
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Pattern
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
 
 YT_CFG_RE = r"ytcfg\.set\s*\(\s*({.+?})\s*\)\s*;"
 YT_INITIAL_DATA_RE = (
@@ -10,75 +16,97 @@ YT_INITIAL_DATA_RE = (
     r"\s*(?:var\s+meta|</script|\n)"
 )
 
+_YT_CFG_RE = re.compile(YT_CFG_RE, re.DOTALL)
+_YT_INITIAL_DATA_RE = re.compile(YT_INITIAL_DATA_RE, re.DOTALL)
+_YT_CFG_START_RE = re.compile(r"ytcfg\.set\s*\(\s*\{")
+_YT_INITIAL_DATA_START_RE = re.compile(
+    r"(?:window\s*\[\s*[\"']ytInitialData[\"']\s*\]|ytInitialData)\s*=\s*\{"
+)
+_JSON_STRUCTURAL_RE = re.compile(r'[{}"\\]')
+_JSON_STRING_SPECIAL_RE = re.compile(r'["\\]')
+
+
+def _loads(s: str) -> Any:
+    """
+    Parse JSON with orjson when available. orjson is stricter than json (it
+    rejects lone surrogate escapes, NaN, 1e400), so anything it refuses is
+    retried with the stdlib parser; only json's JSONDecodeError escapes.
+    """
+    if HAS_ORJSON:
+        try:
+            return orjson.loads(s)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(s)
+
 
-def _regex_search(text: str, pattern: str, group: int = 1, default: Optional[str] = None) -> Optional[str]:
-    match = re.search(pattern, text, re.DOTALL)
+def _regex_search(text: str, pattern: Pattern[str], group: int = 1, default: Optional[str] = None) -> Optional[str]:
+    match = pattern.search(text)
     return match.group(group) if match else default
 
 
-def _extract_json_object(text: str, start_pattern: str) -> Optional[str]:
+def _extract_json_object(text: str, start_pattern: Pattern[str]) -> Optional[str]:
     """
     Extract a JSON object from text starting at a pattern match.
     Handles nested braces properly.
     """
-    match = re.search(start_pattern, text)
+    match = start_pattern.search(text)
     if not match:
         return None
 
     start_pos = match.end() - 1  # position of opening '{'
     brace_count = 0
     in_string = False
-    escape_next = False
-
-    for i in range(start_pos, len(text)):
+    pos = start_pos
+
+    # Jump straight to the next character that can change state instead of
+    # stepping through the (multi-megabyte) page one character at a time.
+    while True:
+        found = (_JSON_STRING_SPECIAL_RE if in_string else _JSON_STRUCTURAL_RE).search(text, pos)
+        if not found:
+            return None
+        i = found.start()
         char = text[i]
 
-        if escape_next:
-            escape_next = False
-            continue
-
         if char == "\\":
-            escape_next = True
+            pos = i + 2  # skip the escaped character
             continue
 
-        if char == '"' and not escape_next:
+        if char == '"':
             in_string = not in_string
-            continue
-
-        if in_string:
-            continue
-
-        if char == "{":
+        elif char == "{":
             brace_count += 1
-        elif char == "}":
+        else:
             brace_count -= 1
             if brace_count == 0:
                 return text[start_pos : i + 1]
-
-    return None
+        pos = i + 1
 
 
-def extract_ytcfg(html: str) -> Dict[str, Any]:
-    ytcfg_str = _regex_search(html, YT_CFG_RE, default=None)
-    if not ytcfg_str:
-        ytcfg_str = _extract_json_object(html, r"ytcfg\.set\s*\(\s*\{")
-    if not ytcfg_str:
-        raise RuntimeError("Failed to extract ytcfg")
+def _parse_embedded_json(html: str, pattern: Pattern[str], start_pattern: Pattern[str], name: str) -> Dict[str, Any]:
+    """
+    Parse a JSON blob embedded in a page. The cheap regex match is parsed
+    first; the brace-matching scan only runs if it is missing or not valid
+    JSON (e.g. the lazy match stopped at a "};" inside a string).
+    """
+    data_str = _regex_search(html, pattern, default=None)
+    if data_str:
+        try:
+            return _loads(data_str)
+        except json.JSONDecodeError:
+            pass
+    data_str = _extract_json_object(html, start_pattern)
+    if not data_str:
+        raise RuntimeError(f"Failed to extract {name}")
     try:
-        return json.loads(ytcfg_str)
+        return _loads(data_str)
     except json.JSONDecodeError as e:
-        raise RuntimeError(f"Failed to parse ytcfg JSON: {e}")
+        raise RuntimeError(f"Failed to parse {name} JSON: {e}")
+
+
+def extract_ytcfg(html: str) -> Dict[str, Any]:
+    return _parse_embedded_json(html, _YT_CFG_RE, _YT_CFG_START_RE, "ytcfg")
 
 
 def extract_ytinitialdata(html: str) -> Dict[str, Any]:
-    data_str = _regex_search(html, YT_INITIAL_DATA_RE, default=None)
-    if not data_str:
-        data_str = _extract_json_object(
-            html, r"(?:window\s*\[\s*[\"']ytInitialData[\"']\s*\]|ytInitialData)\s*=\s*\{"
-        )
-    if not data_str:
-        raise RuntimeError("Failed to extract ytInitialData")
-    try:
-        return json.loads(data_str)
-    except json.JSONDecodeError as e:
-        raise RuntimeError(f"Failed to parse ytInitialData JSON: {e}")
+    return _parse_embedded_json(html, _YT_INITIAL_DATA_RE, _YT_INITIAL_DATA_START_RE, "ytInitialData")
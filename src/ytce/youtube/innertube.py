@@ -1,9 +1,15 @@
 from __future__ import annotations
 
-import time
 from typing import Any, Dict
 
 import requests
+from urllib3.exceptions import ReadTimeoutError
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
 
 
 def inertube_ajax_request(
@@ -11,21 +17,44 @@ def inertube_ajax_request(
     endpoint: Dict[str, Any],
     ytcfg: Dict[str, Any],
     *,
-    retries: int = 5,
-    sleep: float = 2.0,
     timeout: int = 60,
 ) -> Dict[str, Any]:
+    """
+    POST a continuation to the InnerTube API and return the decoded response.
+
+    Retries with backoff are handled by the session adapter (see make_session).
+    A non-200 status or a timeout (including read timeouts that exhausted the
+    adapter retries) yields an empty response, so paginating callers stop and
+    keep what they already collected. Other connection failures propagate.
+    """
     url = "https://www.youtube.com" + endpoint["commandMetadata"]["webCommandMetadata"]["apiUrl"]
     payload = {"context": ytcfg["INNERTUBE_CONTEXT"], "continuation": endpoint["continuationCommand"]["token"]}
 
-    for _ in range(retries):
+    try:
+        resp = session.post(url, params={"key": ytcfg["INNERTUBE_API_KEY"]}, json=payload, timeout=timeout)
+    except (requests.exceptions.Timeout, requests.exceptions.RetryError):
+        return {}
+    except requests.exceptions.ConnectionError as e:
+        # Read timeouts that exhausted the adapter retries arrive as a
+        # ConnectionError wrapping MaxRetryError(reason=ReadTimeoutError), not
+        # as Timeout. Resets, DNS failures etc. must still fail the video.
+        if _is_read_timeout(e):
+            return {}
+        raise
+    if resp.status_code != 200:
+        # 403/413 are terminal; anything else already exhausted the adapter retries
+        return {}
+    if HAS_ORJSON:
+        # Parse the raw body directly; skips requests' text decoding step
         try:
-            resp = session.post(url, params={"key": ytcfg["INNERTUBE_API_KEY"]}, json=payload, timeout=timeout)
-            if resp.status_code == 200:
-                return resp.json()
-            if resp.status_code in (403, 413):
-                return {}
-        except requests.exceptions.Timeout:
+            return orjson.loads(resp.content)
+        except orjson.JSONDecodeError:
+            # Stricter than json (lone surrogates in comment text, NaN, 1e400)
             pass
-        time.sleep(sleep)
-    return {}
+    return resp.json()
+
+
+def _is_read_timeout(error: requests.exceptions.ConnectionError) -> bool:
+    """Return True if `error` is the adapter giving up after read timeouts."""
+    reason = getattr(error.args[0], "reason", None) if error.args else None
+    return isinstance(reason, ReadTimeoutError)
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from typing import Any, Dict, Generator, Iterable, List, Optional
+from collections import deque
+from typing import Any, Deque, Dict, Generator, Iterable, Optional
 
 
 def search_dict(partial: Any, search_key: str) -> Generator[Any, None, None]:
@@ -8,7 +9,7 @@ def search_dict(partial: Any, search_key: str) -> Generator[Any, None, None]:
     DFS stack traversal of nested dict/list.
     NOTE: This does NOT preserve list ordering; do NOT use this to build ordered result lists.
     """
-    stack: List[Any] = [partial]
+    stack: Deque[Any] = deque([partial])
     while stack:
         current_item = stack.pop()
         if isinstance(current_item, dict):
@@ -22,7 +23,12 @@ def search_dict(partial: Any, search_key: str) -> Generator[Any, None, None]:
 
 
 def pick_longest_continuation(endpoints: Iterable[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
-    endpoints = list(endpoints)
-    if not endpoints:
-        return None
-    return max(endpoints, key=lambda x: len(x.get("continuationCommand", {}).get("token", "")))
+    # Single pass so generators (e.g. search_dict) are never materialized;
+    # ties keep the first endpoint seen, matching max().
+    best = None
+    best_len = -1
+    for endpoint in endpoints:
+        token_len = len(endpoint.get("continuationCommand", {}).get("token", ""))
+        if token_len > best_len:
+            best, best_len = endpoint, token_len
+    return best
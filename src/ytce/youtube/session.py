@@ -3,6 +3,8 @@ from __future__ import annotations
 import re
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 # Keep the UA identical across scrapers to avoid behavioral divergence.
 USER_AGENT = (
@@ -15,10 +17,48 @@ YT_HIDDEN_INPUT_RE = (
     r'<input\s+type="hidden"\s+name="([A-Za-z0-9_]+)"\s+value="([A-Za-z0-9_\-\.]*)"\s*'
     r'(?:required|)\s*>'
 )
+_YT_HIDDEN_INPUT_RE = re.compile(YT_HIDDEN_INPUT_RE)
+
+# Keep-alive pool size per host. Concurrent comment workers each build their
+# own session (requests.Session is not thread-safe), so this only bounds the
+# connections one session keeps open for reuse.
+POOL_SIZE = 32
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+# InnerTube continuation POSTs only read data, so they are safe to retry.
+RETRY_METHODS = frozenset({"GET", "POST"})
+
+
+def _retry_policy() -> Retry:
+    """Backoff policy for the session adapter."""
+    kwargs = {
+        "total": 5,
+        "backoff_factor": 0.5,
+        "status_forcelist": RETRY_STATUS_CODES,
+        "raise_on_status": False,
+    }
+    try:
+        return Retry(allowed_methods=RETRY_METHODS, **kwargs)
+    except TypeError:
+        # urllib3 < 1.26 (still allowed by requests>=2.20) calls it method_whitelist
+        return Retry(method_whitelist=RETRY_METHODS, **kwargs)
 
 
 def make_session() -> requests.Session:
+    """
+    Build a session with a pooled HTTPS adapter so connections (and their TLS
+    handshakes) are reused across requests. Share one session between scrapers
+    rather than creating one per scraper.
+
+    Transient failures (429/5xx, dropped connections) are retried by the
+    adapter with exponential backoff, so callers do not need their own loops.
+    """
     session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=POOL_SIZE,
+        pool_maxsize=POOL_SIZE,
+        max_retries=_retry_policy(),
+    )
+    session.mount("https://", adapter)
     session.headers["User-Agent"] = USER_AGENT
     session.cookies.set("CONSENT", "YES+cb", domain=".youtube.com")
     return session
@@ -36,6 +76,6 @@ def handle_consent(
     """
     if "consent" not in str(response.url):
         return response
-    params = dict(re.findall(YT_HIDDEN_INPUT_RE, response.text))
+    params = dict(_YT_HIDDEN_INPUT_RE.findall(response.text))
     params.update({"continue": continue_url, "set_eom": False, "set_ytc": True, "set_apyt": True})
     return session.post(YOUTUBE_CONSENT_URL, params=params, timeout=timeout)
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from ytce.cli.main import build_parser
+from ytce.cli.main import _sniff_subcommand, build_parser
 
 
 def test_parser_init_command():
@@ -70,3 +70,26 @@ def test_parser_version():
     # Version flag exits, so we just check it's registered
     assert any("--version" in action.option_strings for action in parser._actions)
 
+
+def test_parser_single_subcommand():
+    """Test a parser built for one subcommand parses it like the full tree."""
+    parser = build_parser("comments")
+    args = parser.parse_args(["comments", "abc123", "--limit", "5"])
+    assert args.cmd == "comments"
+    assert args.limit == 5
+    assert build_parser("comments") is parser
+
+
+def test_sniff_subcommand():
+    """Test subcommand detection skips global flags and defers to root help."""
+    assert _sniff_subcommand(["channel", "@test", "--limit", "5"]) == "channel"
+    assert _sniff_subcommand(["-v", "batch", "channels.txt"]) == "batch"
+    assert _sniff_subcommand(["-h", "channel"]) is None
+    assert _sniff_subcommand(["bogus"]) is None
+    assert _sniff_subcommand([]) is None
+
+
+def test_parser_stubs_help_matches_full():
+    """Test the help-only stub parser renders the same root help."""
+    full = build_parser().format_help()
+    assert build_parser(stubs=True).format_help() == full
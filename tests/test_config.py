@@ -42,3 +42,33 @@ def test_save_and_load_config():
         if os.path.exists(temp_path):
             os.unlink(temp_path)
 
+
+def test_load_config_picks_up_changes():
+    """Test that editing the config file invalidates the cached parse."""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "ytce.yaml")
+        save_config({"language": "es"}, path)
+        first = load_config(path)
+        assert first["language"] == "es"
+        
+        # Mutating a returned config must not leak into later loads
+        first["language"] = "fr"
+        assert load_config(path)["language"] == "es"
+        
+        save_config({"language": "de", "output_dir": "other"}, path)
+        loaded = load_config(path)
+        assert loaded["language"] == "de"
+        assert loaded["output_dir"] == "other"
+
+
+def test_save_config_exclusive():
+    """Test exclusive save refuses to overwrite an existing config."""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "ytce.yaml")
+        save_config({"language": "es"}, path, exclusive=True)
+        try:
+            save_config({"language": "de"}, path, exclusive=True)
+            assert False, "expected FileExistsError"
+        except FileExistsError:
+            pass
+        assert load_config(path)["language"] == "es"
@@ -60,6 +60,13 @@ def test_handle_key_error():
     assert exit_code == EXIT_NETWORK_ERROR
 
 
+def test_handle_attribute_error():
+    """Test handling of AttributeError (YouTube structure change)."""
+    error = AttributeError("'NoneType' object has no attribute 'get'")
+    exit_code = handle_error(error, debug=False)
+    assert exit_code == EXIT_NETWORK_ERROR
+
+
 def test_handle_unknown_error():
     """Test handling of unknown error."""
     error = ValueError("Unknown error")
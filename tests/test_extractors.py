@@ -0,0 +1,71 @@
+"""Tests for extracting JSON blobs embedded in YouTube pages."""
+
+from __future__ import annotations
+
+import pytest
+
+from ytce.youtube.extractors import (
+    _YT_CFG_START_RE,
+    _extract_json_object,
+    extract_ytcfg,
+    extract_ytinitialdata,
+)
+
+
+def _extract(obj: str, tail: str = "); var x = {};") -> str:
+    return _extract_json_object("<script>ytcfg.set(" + obj + tail, _YT_CFG_START_RE)
+
+
+def test_extract_json_object_nesting():
+    """Test that nested objects are matched up to the closing brace."""
+    obj = '{"a": {"b": {"c": 1}}, "d": [{"e": {}}]}'
+    assert _extract(obj) == obj
+
+
+def test_extract_json_object_braces_in_strings():
+    """Test that braces inside strings do not count towards nesting."""
+    obj = '{"a": "}}}", "b": "{", "c": {"d": "}{"}}'
+    assert _extract(obj) == obj
+
+
+def test_extract_json_object_escapes():
+    """Test escaped quotes and escaped backslashes inside strings."""
+    # \" does not end the string, so the brace after it is still text
+    obj = r'{"a": "say \"}\" ok", "b": 1}'
+    assert _extract(obj) == obj
+    # \\ is an escaped backslash, so the following quote does end the string
+    obj = r'{"path": "C:\\", "b": {"c": "}"}}'
+    assert _extract(obj) == obj
+    obj = r'{"a": "\\\"}", "b": "\\\\"}'
+    assert _extract(obj) == obj
+
+
+def test_extract_json_object_unterminated():
+    """Test that missing starts and unterminated objects/strings yield None."""
+    assert _extract_json_object("<html>no config here</html>", _YT_CFG_START_RE) is None
+    assert _extract('{"a": {"b": 1}', tail="") is None
+    assert _extract('{"a": "open string}', tail="") is None
+    assert _extract('{"a": "ends in escape\\', tail="") is None
+
+
+def test_extract_ytcfg_falls_back_to_brace_scan():
+    """Test that an invalid lazy regex match falls back to the brace scan."""
+    # The lazy regex stops at the "});" inside the string value
+    html = '<script>ytcfg.set({"a": "x});y", "b": {"c": 1}});</script>'
+    assert extract_ytcfg(html) == {"a": "x});y", "b": {"c": 1}}
+
+
+def test_extract_ytinitialdata():
+    """Test ytInitialData extraction and the missing-data error."""
+    html = '<script>var ytInitialData = {"contents": {"n": 1}};</script>'
+    assert extract_ytinitialdata(html) == {"contents": {"n": 1}}
+    with pytest.raises(RuntimeError, match="Failed to extract ytInitialData"):
+        extract_ytinitialdata("<html></html>")
+
+
+def test_extract_ytcfg_lone_surrogate():
+    """Test JSON that only the stdlib parser accepts is still extracted."""
+    html = '<script>ytcfg.set({"title": "\\ud83d", "big": 1e400});</script>'
+    data = extract_ytcfg(html)
+    assert data["title"] == "\ud83d"
+    assert data["big"] == float("inf")
@@ -0,0 +1,59 @@
+"""Tests for InnerTube continuation requests."""
+
+from __future__ import annotations
+
+import pytest
+import requests
+from urllib3.exceptions import MaxRetryError, ReadTimeoutError
+
+from ytce.youtube.innertube import inertube_ajax_request
+
+ENDPOINT = {
+    "commandMetadata": {"webCommandMetadata": {"apiUrl": "/youtubei/v1/next"}},
+    "continuationCommand": {"token": "abc"},
+}
+YTCFG = {"INNERTUBE_CONTEXT": {}, "INNERTUBE_API_KEY": "key"}
+
+
+class _FailingSession:
+    def __init__(self, error):
+        self.error = error
+
+    def post(self, *args, **kwargs):
+        raise self.error
+
+
+def test_exhausted_retries_yield_empty_response():
+    """Test that timeouts and exhausted adapter retries end pagination quietly."""
+    # What a read timeout looks like once the adapter Retry gives up
+    read_timeout = MaxRetryError(None, "/youtubei/v1/next", ReadTimeoutError(None, "/", "Read timed out."))
+    for error in (
+        requests.exceptions.ConnectTimeout("connect timed out"),
+        requests.exceptions.ReadTimeout("read timed out"),
+        requests.exceptions.ConnectionError(read_timeout),
+        requests.exceptions.RetryError("too many 503 error responses"),
+    ):
+        assert inertube_ajax_request(_FailingSession(error), ENDPOINT, YTCFG) == {}
+
+
+def test_connection_failures_propagate():
+    """Test that resets, DNS failures etc. are not mistaken for the end of pagination."""
+    error = requests.exceptions.ConnectionError("Connection reset")
+    with pytest.raises(requests.exceptions.ConnectionError):
+        inertube_ajax_request(_FailingSession(error), ENDPOINT, YTCFG)
+
+
+def test_falls_back_to_stdlib_json():
+    """Test bodies orjson rejects (lone surrogates, NaN) still parse."""
+    resp = requests.Response()
+    resp.status_code = 200
+    resp.encoding = "utf-8"
+    resp._content = b'{"text": "broken emoji \\ud83d", "votes": NaN}'
+
+    class _Session:
+        def post(self, *args, **kwargs):
+            return resp
+
+    data = inertube_ajax_request(_Session(), ENDPOINT, YTCFG)
+    assert data["text"] == "broken emoji \ud83d"
+    assert data["votes"] != data["votes"]  # NaN
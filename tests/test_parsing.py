@@ -0,0 +1,30 @@
+"""Tests for view count parsing."""
+
+from __future__ import annotations
+
+from ytce.utils.parsing import parse_view_count
+
+
+def test_parse_view_count_plain():
+    """Test plain and comma-separated view counts."""
+    assert parse_view_count("123,874 views") == 123874
+    assert parse_view_count("42 views") == 42
+
+
+def test_parse_view_count_suffixes():
+    """Test K/M/B suffixes, in either case."""
+    assert parse_view_count("500K views") == 500_000
+    assert parse_view_count("1.2M views") == 1_200_000
+    assert parse_view_count("3b views") == 3_000_000_000
+
+
+def test_parse_view_count_localized_separators():
+    """Test narrow and non-breaking spaces used as thousands separators."""
+    assert parse_view_count("1 234\xa0567 views") == 1234567
+    assert parse_view_count("12\u202f345 views") == 12345
+
+
+def test_parse_view_count_invalid():
+    """Test empty and non-numeric input."""
+    assert parse_view_count("") is None
+    assert parse_view_count("No views") is None
@@ -8,8 +8,10 @@ from ytce.storage.paths import (
     channel_comments_dir,
     channel_output_dir,
     channel_videos_path,
+    comments_format,
     video_comments_filename,
     video_comments_path,
+    videos_format,
 )
 
 
@@ -59,3 +61,17 @@ def test_sanitize_channel_handle():
     assert "@" not in path
     assert "channelname" in path
 
+
+def test_output_format_mapping():
+    """Test output format to comments/videos file format mapping."""
+    assert comments_format("csv") == "csv"
+    assert comments_format("parquet") == "parquet"
+    assert comments_format("json") == "jsonl"
+    assert comments_format("jsonl") == "jsonl"
+    
+    assert videos_format("csv") == "csv"
+    assert videos_format("parquet") == "parquet"
+    assert videos_format("json") == "json"
+    
+    filename = video_comments_filename(7, "abc", format="parquet")
+    assert filename == "0007_abc.parquet"
@@ -0,0 +1,76 @@
+"""Tests for the channel scraping pipeline (YouTube access is mocked)."""
+
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+from unittest.mock import Mock, patch
+
+from ytce.pipelines.scraper import ScrapeConfig, scrape_channel
+
+VIDEO_IDS = ["v1", "v2", "v3", "v4", "v5", "v6"]
+
+
+class FakeChannelVideosScraper:
+    def __init__(self, debug=False, session=None):
+        pass
+
+    def get_all_videos(self, channel_id, max_videos=None, show_progress=False):
+        return [{"video_id": vid, "order": i} for i, vid in enumerate(VIDEO_IDS, 1)]
+
+
+class FakeCommentDownloader:
+    def __init__(self, session=None):
+        self.session = session if session is not None else Mock()
+
+    def get_comments(self, video_id, **kwargs):
+        if video_id == "v2":
+            # Comments turned off: the real downloader yields nothing
+            return
+        if video_id == "v3":
+            raise RuntimeError("Comments disabled for this video")
+        if video_id == "v4":
+            raise RuntimeError("network error")
+        yield {"_total_count": 5}
+        for i in range(5):
+            yield {"cid": f"{video_id}-{i}", "text": "héllo"}
+
+
+def _scrape(workers, quiet):
+    with tempfile.TemporaryDirectory() as tmp, \
+            patch("ytce.pipelines.scraper.make_session", Mock), \
+            patch("ytce.pipelines.scraper.YoutubeChannelVideosScraper", FakeChannelVideosScraper), \
+            patch("ytce.pipelines.scraper.YoutubeCommentDownloader", FakeCommentDownloader):
+        out_dir = os.path.join(tmp, "channel")
+        stats = scrape_channel(ScrapeConfig(
+            channel_id="@test",
+            out_dir=out_dir,
+            per_video_limit=3,
+            format="jsonl",
+            quiet=quiet,
+            workers=workers,
+        ))
+        comments_dir = os.path.join(out_dir, "comments")
+        files = {}
+        for name in sorted(os.listdir(comments_dir)):
+            with open(os.path.join(comments_dir, name), "r", encoding="utf-8") as f:
+                files[name] = [json.loads(line)["cid"] for line in f]
+        return stats, files
+
+
+def test_scrape_channel_sequential_and_concurrent():
+    """Test totals, per-video files, limits and failed videos for 1 and many workers."""
+    for workers, quiet in ((1, True), (4, True), (1, False), (4, False)):
+        stats, files = _scrape(workers, quiet)
+
+        assert stats.status == "ok"
+        assert stats.videos == len(VIDEO_IDS)
+        # v2 has no comments, v3/v4 fail; the rest are capped by per_video_limit
+        assert stats.comments == 9
+        assert files == {
+            "0001_v1.jsonl": ["v1-0", "v1-1", "v1-2"],
+            "0002_v2.jsonl": [],
+            "0005_v5.jsonl": ["v5-0", "v5-1", "v5-2"],
+            "0006_v6.jsonl": ["v6-0", "v6-1", "v6-2"],
+        }
@@ -0,0 +1,144 @@
+"""Tests for output writers."""
+
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+from unittest.mock import patch
+
+import pytest
+
+from ytce.storage.writers import (
+    comment_writer,
+    get_file_size,
+    videos_writer,
+    write_csv,
+    write_json,
+    write_jsonl,
+    write_parquet,
+    write_videos_csv,
+)
+
+
+def test_write_jsonl_roundtrip():
+    """Test that JSONL output has one parseable record per line."""
+    items = [
+        {"cid": "a", "text": "héllo 👋", "votes": "3", "heart": False},
+        {"cid": "b", "text": "line\nbreak", "votes": "0", "heart": True},
+    ]
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "comments.jsonl")
+
+        count = write_jsonl(path, iter(items))
+
+        assert count == 2
+        with open(path, "r", encoding="utf-8") as f:
+            lines = f.read().splitlines()
+        assert [json.loads(line) for line in lines] == items
+        # Non-ASCII text is written as UTF-8, not escaped
+        assert "héllo 👋" in lines[0]
+
+
+def test_write_jsonl_progress_callback():
+    """Test that progress callback receives running counts."""
+    seen = []
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "comments.jsonl")
+        write_jsonl(path, ({"i": i} for i in range(3)), progress_callback=seen.append)
+    assert seen == [1, 2, 3]
+
+
+def test_write_jsonl_empty():
+    """Test writing no items creates an empty file."""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "nested", "comments.jsonl")
+        assert write_jsonl(path, []) == 0
+        assert os.path.getsize(path) == 0
+
+
+def test_write_json_roundtrip():
+    """Test JSON payload is indented and readable back."""
+    payload = {"channel_id": "@test", "videos": [{"title": "Ünïcode", "view_count": None}]}
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "videos.json")
+
+        write_json(path, payload)
+
+        with open(path, "r", encoding="utf-8") as f:
+            text = f.read()
+        assert json.loads(text) == payload
+        assert "Ünïcode" in text
+        assert '\n  "videos"' in text
+
+
+def test_write_jsonl_keeps_items_before_error():
+    """Test that items yielded before a source error are still written."""
+    def items():
+        yield {"cid": "a"}
+        yield {"cid": "b"}
+        raise RuntimeError("network error")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "comments.jsonl")
+        try:
+            write_jsonl(path, items())
+        except RuntimeError:
+            pass
+        with open(path, "r", encoding="utf-8") as f:
+            assert [json.loads(line)["cid"] for line in f] == ["a", "b"]
+
+
+def test_get_file_size():
+    """Test file size lookup, including missing files."""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "comments.jsonl")
+        assert get_file_size(path) == 0
+        write_jsonl(path, [{"cid": "a"}])
+        assert get_file_size(path) == os.path.getsize(path) > 0
+
+
+def test_writer_dispatch():
+    """Test output format to writer lookup, including defaults."""
+    assert comment_writer("csv") is write_csv
+    assert comment_writer("jsonl") is write_jsonl
+    assert comment_writer("json") is write_jsonl
+    assert videos_writer("csv") is write_videos_csv
+    assert videos_writer("json") is write_json
+    assert videos_writer("jsonl") is write_json
+
+
+def test_write_parquet_schema_drift():
+    """Test later row groups may fill all-None columns and add new keys."""
+    pq = pytest.importorskip("pyarrow.parquet")
+    items = [
+        {"cid": "a", "votes": 1, "heart": None},
+        {"cid": "b", "votes": 2, "heart": None},
+        {"cid": "c", "votes": 3, "heart": True},
+        {"cid": "d", "votes": 4.5, "heart": False},
+        {"cid": "e", "votes": 5, "heart": None, "reply": True},
+    ]
+    with tempfile.TemporaryDirectory() as tmp, \
+            patch("ytce.storage.writers.PARQUET_ROW_GROUP_SIZE", 2):
+        path = os.path.join(tmp, "comments.parquet")
+
+        assert write_parquet(path, iter(items)) == 5
+
+        table = pq.read_table(path)
+        assert pq.ParquetFile(path).num_row_groups == 3
+        assert table.column_names == ["cid", "votes", "heart", "reply"]
+        assert table.column("votes").to_pylist() == [1, 2, 3, 4.5, 5]
+        assert table.column("heart").to_pylist() == [None, None, True, False, None]
+        assert table.column("reply").to_pylist() == [None, None, None, None, True]
+        assert os.listdir(tmp) == ["comments.parquet"]
+
+
+def test_write_parquet_incompatible_types():
+    """Test a column whose type cannot be promoted fails with a clear error."""
+    pytest.importorskip("pyarrow")
+    items = [{"votes": 1}, {"votes": 2}, {"votes": "three"}]
+    with tempfile.TemporaryDirectory() as tmp, \
+            patch("ytce.storage.writers.PARQUET_ROW_GROUP_SIZE", 2):
+        path = os.path.join(tmp, "comments.parquet")
+        with pytest.raises(ValueError, match="column types changed"):
+            write_parquet(path, iter(items))